@@ -1,19 +1,52 @@
 # config.py - 添加到项目根目录
 import os
 
+# 缓存已解析的Qt插件路径，避免重复的文件系统stat调用
+_CACHED_QT_PATH = None
+
+
+def _debug(msg):
+    """仅在设置 DAS_DEBUG 环境变量时输出调试信息"""
+    if os.environ.get('DAS_DEBUG'):
+        print(msg)
+
 
 def setup_qt_environment():
-    """设置Qt环境变量"""
-    # Qt插件路径
-    qt_plugins_path = r'C:\Users\17981\Desktop\科研\optic_code\new_denoise\.venv\Lib\site-packages\PyQt5\Qt5\plugins'
-    if os.path.exists(qt_plugins_path):
-        os.environ['QT_QPA_PLATFORM_PLUGIN_PATH'] = qt_plugins_path
+    """设置Qt环境变量（惰性执行，结果缓存）"""
+    global _CACHED_QT_PATH
+    if _CACHED_QT_PATH is not None:
+        return _CACHED_QT_PATH
+
+    # 获取当前脚本的绝对路径所在目录（项目根目录）
+    project_root = os.path.dirname(os.path.abspath(__file__))
+    _debug(f"[DEBUG] 项目根目录: {project_root}")
+
+    # 拼接实际的虚拟环境目录路径
+    venv_dir = os.path.join(project_root, ".venv")
+    qt_root = os.path.join(venv_dir, "Lib", "site-packages", "PyQt5", "Qt5")
+
+    # 构建完整的平台插件路径
+    platforms_path = os.path.join(qt_root, "plugins", "platforms")
+
+    # 构建 bin 目录路径
+    bin_path = os.path.join(qt_root, "bin")
+
+    if os.path.exists(platforms_path):
+        os.environ['QT_QPA_PLATFORM_PLUGIN_PATH'] = platforms_path
+        _debug(f"[DEBUG] 设置 QT_QPA_PLATFORM_PLUGIN_PATH = {platforms_path}")
+
+    if os.path.exists(qt_root):
+        os.environ['QTDIR'] = qt_root
+
+    # 确保 DLL 路径
+    if os.path.exists(bin_path):
+        os.environ['PATH'] = f"{bin_path}{os.pathsep}{os.environ['PATH']}"
+        _debug(f"[DEBUG] 添加 PATH: {bin_path}")
 
-    # Qt根路径
-    qt_path = r'C:\Users\17981\Desktop\科研\optic_code\new_denoise\.venv\Lib\site-packages\PyQt5\Qt5'
-    if os.path.exists(qt_path):
-        os.environ['QTDIR'] = qt_path
+    _CACHED_QT_PATH = platforms_path
+    return _CACHED_QT_PATH
 
 
-# 程序启动时自动设置
-setup_qt_environment()
+def ensure_qt():
+    """GUI入口在创建QApplication前调用，确保Qt环境变量已设置"""
+    return setup_qt_environment()
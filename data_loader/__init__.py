@@ -1,5 +1,24 @@
 # data_loader/__init__.py
-from .matlab_loader import MatlabLoader
-from .data_loader_factory import DataLoaderFactory
+# PEP 562惰性导入：延迟scipy.io等重依赖到实际使用时
 
 __all__ = ['MatlabLoader', 'DataLoaderFactory']
+
+_MODULE_BY_NAME = {
+    'MatlabLoader': '.matlab_loader',
+    'DataLoaderFactory': '.data_loader_factory',
+}
+
+
+def __getattr__(name):
+    module_name = _MODULE_BY_NAME.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # 缓存，后续访问不再走__getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,6 +4,13 @@ import numpy as np
 import os
 from utils.file_utils import check_file_exists
 
+try:
+    import h5py
+
+    H5PY_AVAILABLE = True
+except ImportError:
+    H5PY_AVAILABLE = False
+
 
 class MatlabLoader:
     """
@@ -11,6 +18,10 @@ class MatlabLoader:
     支持加载.mat文件中的DAS数据
     """
 
+    # 按 (绝对路径, mtime_ns, 大小, 变量名) 缓存已解析结果，
+    # 避免对同一文件重复执行完整的loadmat解析
+    _cache = {}
+
     def __init__(self, file_path=None):
         """
         初始化MATLAB加载器
@@ -22,16 +33,21 @@ class MatlabLoader:
         self.data = None
         self.metadata = None
 
-    def load_data(self, file_path=None, variable_name=None):
+    def load_data(self, file_path=None, variable_name=None, lazy=False,
+                  chunk_callback=None):
         """
         加载MATLAB数据文件
 
         Args:
             file_path (str): 文件路径
             variable_name (str): 要加载的变量名
+            lazy (bool): 仅扫描变量名/形状等元数据，不加载数组内容
+            chunk_callback (callable): 若提供，则按块流式读取数据并逐块
+                回调（见iter_chunks），不在内存中保留完整数组
 
         Returns:
             tuple: (data, metadata) 数据和元数据
+                （lazy=True或使用chunk_callback时data为None）
         """
         if file_path is not None:
             self.file_path = file_path
@@ -39,9 +55,33 @@ class MatlabLoader:
         if not check_file_exists(self.file_path):
             raise FileNotFoundError(f"文件不存在: {self.file_path}")
 
+        if lazy:
+            self.data = None
+            self.metadata = self._scan_metadata()
+            return self.data, self.metadata
+
+        if chunk_callback is not None:
+            for chunk in self.iter_chunks(variable_name):
+                chunk_callback(chunk)
+            self.data = None
+            self.metadata = self._scan_metadata()
+            return self.data, self.metadata
+
+        # 以文件指纹为键查缓存，文件被修改后指纹变化自动失效
+        file_stat = os.stat(self.file_path)
+        cache_key = (os.path.abspath(self.file_path),
+                     file_stat.st_mtime_ns, file_stat.st_size, variable_name)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self.data, self.metadata = cached
+            return self.data, self.metadata
+
         try:
-            # 加载.mat文件
-            mat_data = scipy.io.loadmat(self.file_path)
+            # 加载.mat文件；指定变量名时只解析该变量，
+            # 其余变量连解压都不做，避免把整个文件物化进内存
+            mat_data = scipy.io.loadmat(
+                self.file_path,
+                variable_names=[variable_name] if variable_name else None)
 
             # 如果指定了变量名，直接加载该变量
             if variable_name:
@@ -50,25 +90,119 @@ class MatlabLoader:
                 else:
                     raise KeyError(f"变量 '{variable_name}' 在文件中不存在")
             else:
-                # 自动查找数据变量（排除MATLAB内部变量）
-                data_vars = {k: v for k, v in mat_data.items()
-                             if not k.startswith('__') and not k.endswith('__')}
-                if len(data_vars) == 1:
-                    self.data = list(data_vars.values())[0]
-                elif len(data_vars) > 1:
+                # 自动查找数据变量（排除MATLAB内部变量），只遍历一次键、
+                # 不额外物化包含所有数组值的临时字典
+                data_keys = [k for k in mat_data
+                             if not (k.startswith('__') and k.endswith('__'))]
+                if len(data_keys) == 1:
+                    self.data = mat_data[data_keys[0]]
+                elif len(data_keys) > 1:
                     # 如果有多个变量，返回字典形式
-                    self.data = data_vars
+                    self.data = {k: mat_data[k] for k in data_keys}
                 else:
                     raise ValueError("文件中没有找到有效的数据变量")
 
+            # 标记为只读：缓存和控制器共享同一份数组，
+            # 下游流水线都是读时复制，这里兜底防止意外原地改写
+            if isinstance(self.data, np.ndarray):
+                self.data.setflags(write=False)
+            elif isinstance(self.data, dict):
+                for value in self.data.values():
+                    if isinstance(value, np.ndarray):
+                        value.setflags(write=False)
+
             # 提取元数据
             self.metadata = self._extract_metadata(mat_data)
 
+            # 写入缓存前清除同一文件的过期条目
+            stale_keys = [k for k in self._cache
+                          if k[0] == cache_key[0] and k != cache_key]
+            for k in stale_keys:
+                del self._cache[k]
+            self._cache[cache_key] = (self.data, self.metadata)
+
             return self.data, self.metadata
 
         except Exception as e:
             raise Exception(f"加载MATLAB文件失败: {str(e)}")
 
+    def iter_chunks(self, variable_name, chunk_bytes=256 * 1024 * 1024, axis=0):
+        """
+        沿指定轴按块流式读取变量，控制峰值内存占用
+
+        MAT v7.3文件（HDF5格式）通过h5py逐块读取磁盘数据；
+        旧版MAT文件不支持部分读取，退化为一次加载后按块切片
+
+        Args:
+            variable_name (str): 要读取的变量名
+            chunk_bytes (int): 每块的目标字节数，默认256MB
+            axis (int): 切块方向
+
+        Yields:
+            np.ndarray: 数据块
+        """
+        if not check_file_exists(self.file_path):
+            raise FileNotFoundError(f"文件不存在: {self.file_path}")
+
+        if H5PY_AVAILABLE and h5py.is_hdf5(self.file_path):
+            with h5py.File(self.file_path, 'r') as f:
+                if variable_name not in f:
+                    raise KeyError(f"变量 '{variable_name}' 在文件中不存在")
+                dataset = f[variable_name]
+                # 按目标字节数折算每块沿axis的切片数
+                slab_bytes = dataset.dtype.itemsize * max(
+                    1, int(np.prod([s for i, s in enumerate(dataset.shape)
+                                    if i != axis]))
+                )
+                step = max(1, chunk_bytes // slab_bytes)
+                index = [slice(None)] * dataset.ndim
+                for start in range(0, dataset.shape[axis], step):
+                    index[axis] = slice(start, start + step)
+                    yield dataset[tuple(index)]
+        else:
+            data, _ = self.load_data(variable_name=variable_name)
+            data = np.asarray(data)
+            slab_bytes = data.itemsize * max(1, data.size // data.shape[axis])
+            step = max(1, chunk_bytes // slab_bytes)
+            index = [slice(None)] * data.ndim
+            for start in range(0, data.shape[axis], step):
+                index[axis] = slice(start, start + step)
+                yield data[tuple(index)]
+
+    def _scan_metadata(self):
+        """
+        只读取文件头信息构建元数据，不加载数组内容
+
+        Returns:
+            dict: 元数据字典（含各变量的形状和类型）
+        """
+        try:
+            # MAT v5/v6/v7: whosmat 只扫描头部
+            variables = scipy.io.whosmat(self.file_path)
+            variable_info = {name: {'shape': shape, 'dtype': dtype}
+                             for name, shape, dtype in variables}
+        except NotImplementedError:
+            # MAT v7.3 为HDF5格式，需通过h5py读取结构
+            if not H5PY_AVAILABLE:
+                raise ImportError(
+                    "读取MAT v7.3文件的元数据需要h5py库，请运行 'pip install h5py'"
+                )
+            with h5py.File(self.file_path, 'r') as f:
+                variable_info = {
+                    name: {'shape': dset.shape, 'dtype': str(dset.dtype)}
+                    for name, dset in f.items()
+                    if isinstance(dset, h5py.Dataset)
+                }
+
+        return {
+            'file_path': self.file_path,
+            'file_size': os.path.getsize(self.file_path),
+            'variables': list(variable_info.keys()),
+            'variable_info': variable_info,
+            'data_shape': None,
+            'data_type': None
+        }
+
     def _extract_metadata(self, mat_data):
         """
         从MATLAB文件中提取元数据
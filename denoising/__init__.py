@@ -1,10 +1,6 @@
 # denoising/__init__.py
-from .gaussian_filter import GaussianFilter
-from .moving_average_filter import MovingAverageFilter
-from .median_filter import MedianFilter
-from .denoising_factory import DenoisingFactory
-from .wavelet_denoising import WaveletDenoising
-from .bilateral_filter import BilateralFilter
+# PEP 562惰性导入：按需加载各滤波器模块，
+# 避免只用一种滤波器的调用方付出完整的scipy/pywt冷启动开销
 
 __all__ = ['GaussianFilter',
            'MovingAverageFilter',
@@ -12,3 +8,27 @@ __all__ = ['GaussianFilter',
            "WaveletDenoising",
            "BilateralFilter",
            'DenoisingFactory']
+
+_MODULE_BY_NAME = {
+    'GaussianFilter': '.gaussian_filter',
+    'MovingAverageFilter': '.moving_average_filter',
+    'MedianFilter': '.median_filter',
+    'WaveletDenoising': '.wavelet_denoising',
+    'BilateralFilter': '.bilateral_filter',
+    'DenoisingFactory': '.denoising_factory',
+}
+
+
+def __getattr__(name):
+    module_name = _MODULE_BY_NAME.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # 缓存，后续访问不再走__getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,31 @@
+# denoising/_threshold_kernels.py
+# 小波系数阈值处理的numba内核：原地单遍扫描，不分配临时数组，
+# prange跨核并行，内层无分支依赖，便于LLVM自动向量化
+import math
+
+try:
+    import numba
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def soft_inplace(a, t):
+        """对连续数组a原地做软阈值收缩"""
+        flat = a.ravel()
+        for i in numba.prange(flat.size):
+            x = flat[i]
+            if abs(x) <= t:
+                flat[i] = 0.0
+            else:
+                flat[i] = x - math.copysign(t, x)
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def hard_inplace(a, t):
+        """对连续数组a原地做硬阈值处理"""
+        flat = a.ravel()
+        for i in numba.prange(flat.size):
+            if abs(flat[i]) <= t:
+                flat[i] = 0.0
@@ -1,7 +1,94 @@
 # denoising/bilateral_filter.py
+import functools
+
 import numpy as np
 from scipy import ndimage
-from scipy.spatial.distance import cdist
+
+try:
+    import numba
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import cupy as cp
+
+    CUPY_AVAILABLE = cp.cuda.runtime.getDeviceCount() > 0
+except Exception:
+    CUPY_AVAILABLE = False
+
+# 数据量超过该阈值时GPU的传输开销才能被计算收益摊销
+GPU_SIZE_THRESHOLD = 1_000_000
+
+if NUMBA_AVAILABLE:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _bilateral_1d_numba(data, spatial_weights, intensity_lut, lut_inv_step,
+                            half_window):
+        """Numba编译的1D双边滤波核心循环（强度权重查表）"""
+        n = data.shape[0]
+        lut_max = intensity_lut.shape[0] - 1
+        filtered_data = np.zeros_like(data)
+        for i in numba.prange(n):
+            start_idx = i - half_window
+            if start_idx < 0:
+                start_idx = 0
+            end_idx = i + half_window + 1
+            if end_idx > n:
+                end_idx = n
+            center_value = data[i]
+            weight_sum = 0.0
+            value_sum = 0.0
+            for idx in range(start_idx, end_idx):
+                diff = abs(data[idx] - center_value)
+                bin_idx = int(diff * lut_inv_step)
+                if bin_idx > lut_max:
+                    bin_idx = lut_max
+                w = spatial_weights[half_window + idx - i] * intensity_lut[bin_idx]
+                weight_sum += w
+                value_sum += w * data[idx]
+            if weight_sum > 0:
+                filtered_data[i] = value_sum / weight_sum
+            else:
+                filtered_data[i] = center_value
+        return filtered_data
+
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _bilateral_2d_numba(padded, spatial_weights, intensity_lut, lut_inv_step,
+                            half_window):
+        """
+        Numba编译的2D双边滤波核心循环（强度权重查表）
+
+        输入为反射填充后的连续数组，内层k×k循环无边界分支，
+        便于LLVM自动SIMD向量化；行方向由prange并行；
+        强度高斯权重由L1驻留的查找表代替逐点exp
+        """
+        window_size = 2 * half_window + 1
+        rows = padded.shape[0] - 2 * half_window
+        cols = padded.shape[1] - 2 * half_window
+        lut_max = intensity_lut.shape[0] - 1
+        filtered_data = np.zeros((rows, cols), dtype=padded.dtype)
+        for i in numba.prange(rows):
+            for j in range(cols):
+                center_value = padded[i + half_window, j + half_window]
+                weight_sum = 0.0
+                value_sum = 0.0
+                for r in range(window_size):
+                    for c in range(window_size):
+                        value = padded[i + r, j + c]
+                        diff = abs(value - center_value)
+                        bin_idx = int(diff * lut_inv_step)
+                        if bin_idx > lut_max:
+                            bin_idx = lut_max
+                        w = spatial_weights[r, c] * intensity_lut[bin_idx]
+                        weight_sum += w
+                        value_sum += w * value
+                if weight_sum > 0:
+                    filtered_data[i, j] = value_sum / weight_sum
+                else:
+                    filtered_data[i, j] = center_value
+        return filtered_data
 
 
 class BilateralFilter:
@@ -11,7 +98,8 @@ class BilateralFilter:
     在平滑噪声的同时保持数据的重要特征（如边缘）
     """
 
-    def __init__(self, spatial_sigma=1.0, intensity_sigma=10.0, window_size=5):
+    def __init__(self, spatial_sigma=1.0, intensity_sigma=10.0, window_size=5,
+                 dtype=np.float32):
         """
         初始化双边滤波器
 
@@ -19,10 +107,15 @@ class BilateralFilter:
             spatial_sigma (float): 空间域标准差，控制空间邻近度权重
             intensity_sigma (float): 强度域标准差，控制强度相似度权重
             window_size (int): 滤波窗口大小
+            dtype (np.dtype): 内部计算精度，默认float32以减半内存带宽
         """
         self.spatial_sigma = spatial_sigma
         self.intensity_sigma = intensity_sigma
         self.window_size = window_size
+        self.dtype = dtype
+        # 跨调用复用的权重缓存（批量处理多帧时避免重复的exp计算）
+        self._spatial_weights_cache = {}
+        self._intensity_lut_cache = {}
 
     def denoise(self, data, spatial_sigma=None, intensity_sigma=None, window_size=None):
         """
@@ -42,8 +135,10 @@ class BilateralFilter:
         intensity_sigma = intensity_sigma if intensity_sigma is not None else self.intensity_sigma
         window_size = window_size if window_size is not None else self.window_size
 
-        # 确保输入数据是numpy数组
-        data = np.asarray(data, dtype=np.float64)
+        # 确保输入数据是numpy数组（内部以float32计算以减半内存带宽）
+        data = np.asarray(data)
+        input_dtype = data.dtype
+        data = data.astype(self.dtype, copy=False)
 
         # 根据数据维度选择处理方法
         if data.ndim == 1:
@@ -57,6 +152,10 @@ class BilateralFilter:
         else:
             raise ValueError("不支持的数据维度，仅支持1D和2D数据")
 
+        # 调用方传入float64时保持输出精度一致
+        if input_dtype == np.float64:
+            denoised_data = denoised_data.astype(np.float64)
+
         return denoised_data
 
     def _bilateral_filter_1d(self, data, spatial_sigma, intensity_sigma, window_size):
@@ -80,7 +179,18 @@ class BilateralFilter:
         filtered_data = np.zeros_like(data)
 
         # 预计算空间权重
-        spatial_weights = self._compute_spatial_weights_1d(window_size, spatial_sigma)
+        spatial_weights = self._compute_spatial_weights_1d(
+            window_size, spatial_sigma
+        ).astype(data.dtype, copy=False)
+
+        # 优先使用Numba编译的并行核心
+        if NUMBA_AVAILABLE:
+            intensity_lut, lut_inv_step = self._compute_intensity_lut(
+                intensity_sigma, data.dtype
+            )
+            return _bilateral_1d_numba(
+                data, spatial_weights, intensity_lut, lut_inv_step, half_window
+            )
 
         # 对每个像素进行双边滤波
         for i in range(len(data)):
@@ -102,10 +212,10 @@ class BilateralFilter:
                                      ]
             total_weights = window_spatial_weights * intensity_weights
 
-            # 归一化权重并计算加权平均
-            if np.sum(total_weights) > 0:
-                normalized_weights = total_weights / np.sum(total_weights)
-                filtered_data[i] = np.sum(window_data * normalized_weights)
+            # 加权平均：只求一次权重和，省去显式归一化的额外一遍运算
+            weight_sum = total_weights.sum()
+            if weight_sum > 0:
+                filtered_data[i] = (window_data * total_weights).sum() / weight_sum
             else:
                 filtered_data[i] = center_value
 
@@ -113,7 +223,10 @@ class BilateralFilter:
 
     def _bilateral_filter_2d(self, data, spatial_sigma, intensity_sigma, window_size):
         """
-        2D双边滤波
+        2D双边滤波（向量化实现）
+
+        使用 sliding_window_view 一次性构建 (H, W, k, k) 滑动窗口视图，
+        将逐像素的Python循环替换为批量的NumPy数组运算
 
         Args:
             data (np.ndarray): 2D输入数据
@@ -129,46 +242,149 @@ class BilateralFilter:
             window_size += 1
 
         half_window = window_size // 2
-        filtered_data = np.zeros_like(data)
 
         # 预计算空间权重
-        spatial_weights = self._compute_spatial_weights_2d(window_size, spatial_sigma)
+        spatial_weights = self._compute_spatial_weights_2d(
+            window_size, spatial_sigma
+        ).astype(data.dtype, copy=False)
+
+        # 大数组且GPU可用时转移到CUDA计算
+        if CUPY_AVAILABLE and data.size > GPU_SIZE_THRESHOLD:
+            return self._bilateral_filter_2d_gpu(
+                data, spatial_weights, intensity_sigma, window_size, half_window
+            )
 
-        # 对每个像素进行双边滤波
-        for i in range(data.shape[0]):
-            for j in range(data.shape[1]):
-                # 确定窗口范围
-                row_start = max(0, i - half_window)
-                row_end = min(data.shape[0], i + half_window + 1)
-                col_start = max(0, j - half_window)
-                col_end = min(data.shape[1], j + half_window + 1)
-
-                # 提取窗口数据
-                window_data = data[row_start:row_end, col_start:col_end]
-                center_value = data[i, j]
-
-                # 计算强度差异
-                intensity_diff = window_data - center_value
-                intensity_weights = np.exp(-0.5 * (intensity_diff / intensity_sigma) ** 2)
-
-                # 计算空间权重
-                window_spatial_weights = spatial_weights[
-                                         (half_window - (i - row_start)):(half_window + (row_end - i)),
-                                         (half_window - (j - col_start)):(half_window + (col_end - j))
-                                         ]
-
-                # 计算总权重
-                total_weights = window_spatial_weights * intensity_weights
-
-                # 归一化权重并计算加权平均
-                if np.sum(total_weights) > 0:
-                    normalized_weights = total_weights / np.sum(total_weights)
-                    filtered_data[i, j] = np.sum(window_data * normalized_weights)
-                else:
-                    filtered_data[i, j] = center_value
+        # 优先使用Numba编译的并行核心（在填充后的连续数组上运行）
+        if NUMBA_AVAILABLE:
+            padded = np.ascontiguousarray(
+                np.pad(data, half_window, mode='reflect')
+            )
+            intensity_lut, lut_inv_step = self._compute_intensity_lut(
+                intensity_sigma, data.dtype
+            )
+            return _bilateral_2d_numba(
+                padded, spatial_weights, intensity_lut, lut_inv_step, half_window
+            )
+
+        # scipy >= 1.15: vectorized_filter 分批构建窗口张量，
+        # 在C层处理边界和分批，峰值内存由batch_memory限制
+        if hasattr(ndimage, 'vectorized_filter'):
+            kernel = functools.partial(
+                self._bilateral_kernel,
+                half_window=half_window,
+                spatial_weights=spatial_weights,
+                intensity_sigma=intensity_sigma,
+            )
+            # ndimage的'mirror'对应np.pad的'reflect'边界约定
+            return ndimage.vectorized_filter(
+                data, kernel, size=window_size, mode='mirror',
+                batch_memory=256 * 1024 * 1024
+            )
+
+        # 反射填充后构建滑动窗口视图，形状为 (H, W, k, k)
+        padded = np.pad(data, half_window, mode='reflect')
+        windows = np.lib.stride_tricks.sliding_window_view(
+            padded, (window_size, window_size)
+        )
+
+        # 强度差异权重（以每个像素为中心）
+        intensity_diff = windows - data[..., None, None]
+        intensity_weights = np.exp(-0.5 * (intensity_diff / intensity_sigma) ** 2)
+
+        # 总权重 = 空间权重 × 强度权重，在窗口维度上归一化求和
+        total_weights = intensity_weights * spatial_weights
+        numerator = (total_weights * windows).sum(axis=(-1, -2))
+        denominator = total_weights.sum(axis=(-1, -2))
+
+        filtered_data = numerator / denominator
 
         return filtered_data
 
+    @staticmethod
+    def _bilateral_filter_2d_gpu(data, spatial_weights, intensity_sigma,
+                                 window_size, half_window):
+        """
+        2D双边滤波的GPU实现（CuPy）
+
+        每个输出像素独立计算各自的 (k, k) 窗口加权平均，
+        属于典型的GPU并行负载；计算结构与NumPy向量化路径一致
+
+        Args:
+            data (np.ndarray): 2D输入数据
+            spatial_weights (np.ndarray): 预计算的空间权重 (k, k)
+            intensity_sigma (float): 强度域标准差
+            window_size (int): 滤波窗口大小
+            half_window (int): 窗口半径
+
+        Returns:
+            np.ndarray: 降噪后的数据（主机端数组）
+        """
+        d = cp.asarray(data, dtype=cp.float32)
+        sw = cp.asarray(spatial_weights, dtype=cp.float32)
+
+        padded = cp.pad(d, half_window, mode='reflect')
+        windows = cp.lib.stride_tricks.sliding_window_view(
+            padded, (window_size, window_size)
+        )
+
+        intensity_diff = windows - d[..., None, None]
+        intensity_weights = cp.exp(-0.5 * (intensity_diff / intensity_sigma) ** 2)
+
+        total_weights = intensity_weights * sw
+        numerator = (total_weights * windows).sum(axis=(-1, -2))
+        denominator = total_weights.sum(axis=(-1, -2))
+
+        return cp.asnumpy(numerator / denominator).astype(data.dtype, copy=False)
+
+    @staticmethod
+    def _bilateral_kernel(window, *, axis, half_window, spatial_weights,
+                          intensity_sigma):
+        """
+        供 ndimage.vectorized_filter 调用的双边滤波核
+
+        Args:
+            window (np.ndarray): 批量窗口张量，最后两个轴为 (k, k) 窗口
+            axis (tuple): 窗口所在的轴
+            half_window (int): 窗口半径
+            spatial_weights (np.ndarray): 预计算的空间权重 (k, k)
+            intensity_sigma (float): 强度域标准差
+
+        Returns:
+            np.ndarray: 每个窗口的加权平均值
+        """
+        center = window[..., half_window, half_window]
+        intensity_diff = window - center[..., None, None]
+        intensity_weights = np.exp(-0.5 * (intensity_diff / intensity_sigma) ** 2)
+        total_weights = intensity_weights * spatial_weights
+        return (total_weights * window).sum(axis=axis) / total_weights.sum(axis=axis)
+
+    def _compute_intensity_lut(self, intensity_sigma, dtype, num_bins=1024):
+        """
+        预计算强度高斯权重查找表（按实例缓存）
+
+        覆盖 [0, 6σ] 的强度差范围（6σ之外权重已可忽略），
+        以查表代替逐窗口的exp调用
+
+        Args:
+            intensity_sigma (float): 强度域标准差
+            dtype (np.dtype): 查找表精度
+            num_bins (int): 查找表分辨率
+
+        Returns:
+            tuple: (lut, inv_step) 查找表和索引缩放因子
+        """
+        cache_key = (float(intensity_sigma), np.dtype(dtype).str, num_bins)
+        cached = self._intensity_lut_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        max_diff = 6.0 * intensity_sigma
+        step = max_diff / (num_bins - 1)
+        diffs = np.arange(num_bins) * step
+        lut = np.exp(-0.5 * (diffs / intensity_sigma) ** 2).astype(dtype)
+        self._intensity_lut_cache[cache_key] = (lut, 1.0 / step)
+        return self._intensity_lut_cache[cache_key]
+
     def _compute_spatial_weights_1d(self, window_size, spatial_sigma):
         """
         计算1D空间权重
@@ -180,9 +396,15 @@ class BilateralFilter:
         Returns:
             np.ndarray: 空间权重数组
         """
+        cache_key = ('1d', window_size, float(spatial_sigma))
+        cached = self._spatial_weights_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         half_window = window_size // 2
         distances = np.arange(-half_window, half_window + 1)
         spatial_weights = np.exp(-0.5 * (distances / spatial_sigma) ** 2)
+        self._spatial_weights_cache[cache_key] = spatial_weights
         return spatial_weights
 
     def _compute_spatial_weights_2d(self, window_size, spatial_sigma):
@@ -196,15 +418,25 @@ class BilateralFilter:
         Returns:
             np.ndarray: 空间权重数组
         """
+        cache_key = ('2d', window_size, float(spatial_sigma))
+        cached = self._spatial_weights_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         half_window = window_size // 2
         y, x = np.ogrid[-half_window:half_window + 1, -half_window:half_window + 1]
         distances_squared = x ** 2 + y ** 2
         spatial_weights = np.exp(-0.5 * distances_squared / (spatial_sigma ** 2))
+        self._spatial_weights_cache[cache_key] = spatial_weights
         return spatial_weights
 
     def apply_fast_bilateral_filter(self, data, spatial_sigma=None, intensity_sigma=None):
         """
-        应用快速双边滤波（简化版，使用scipy的高斯滤波近似）
+        应用快速双边滤波（Paris-Durand分层近似）
+
+        将强度范围量化为L个层级，每层做一次可分离高斯模糊
+        （复杂度O(H·W·L)而非逐窗口的O(H·W·k²)），
+        再按每个像素的强度在相邻层级间线性插值
 
         Args:
             data (np.ndarray): 输入数据
@@ -217,11 +449,38 @@ class BilateralFilter:
         spatial_sigma = spatial_sigma if spatial_sigma is not None else self.spatial_sigma
         intensity_sigma = intensity_sigma if intensity_sigma is not None else self.intensity_sigma
 
-        data = np.asarray(data, dtype=np.float64)
+        data = np.asarray(data, dtype=self.dtype)
 
-        # 使用高斯滤波作为双边滤波的近似
-        # 这是一种简化的实现方式
-        denoised_data = ndimage.gaussian_filter(data, sigma=spatial_sigma)
+        data_min = data.min()
+        data_max = data.max()
+        if data_max == data_min:
+            return data.copy()
+
+        # 层级数随强度域标准差增加，至少8层
+        num_levels = max(8, int(2 * intensity_sigma))
+        levels = np.linspace(data_min, data_max, num_levels, dtype=data.dtype)
+
+        # 每层：以该层级为中心的强度权重做归一化高斯模糊
+        layered = np.empty((num_levels,) + data.shape, dtype=data.dtype)
+        for idx, level in enumerate(levels):
+            level_weights = np.exp(-0.5 * ((data - level) / intensity_sigma) ** 2)
+            numerator = ndimage.gaussian_filter(
+                level_weights * data, sigma=spatial_sigma
+            )
+            denominator = ndimage.gaussian_filter(
+                level_weights, sigma=spatial_sigma
+            )
+            layered[idx] = numerator / np.maximum(denominator, np.finfo(data.dtype).tiny)
+
+        # 按像素强度在相邻层级间线性插值
+        position = (data - data_min) / (data_max - data_min) * (num_levels - 1)
+        lower = np.floor(position).astype(np.intp)
+        upper = np.minimum(lower + 1, num_levels - 1)
+        frac = (position - lower).astype(data.dtype)
+
+        grid = tuple(np.indices(data.shape))
+        denoised_data = (layered[(lower,) + grid] * (1 - frac)
+                         + layered[(upper,) + grid] * frac)
 
         return denoised_data
 
@@ -240,20 +499,62 @@ class BilateralFilter:
         spatial_sigma = spatial_sigma if spatial_sigma is not None else self.spatial_sigma
         intensity_sigma = intensity_sigma if intensity_sigma is not None else self.intensity_sigma
 
-        data = np.asarray(data, dtype=np.float64)
+        data = np.asarray(data, dtype=self.dtype)
 
-        # 先对行进行双边滤波
-        temp_data = np.zeros_like(data)
-        for i in range(data.shape[0]):
-            temp_data[i, :] = self._bilateral_filter_1d(
-                data[i, :], spatial_sigma, intensity_sigma, self.window_size
-            )
-
-        # 再对列进行双边滤波
-        filtered_data = np.zeros_like(temp_data)
-        for j in range(temp_data.shape[1]):
-            filtered_data[:, j] = self._bilateral_filter_1d(
-                temp_data[:, j], spatial_sigma, intensity_sigma, self.window_size
-            )
+        # 先对行方向批量滤波，再对列方向批量滤波
+        temp_data = self._bilateral_filter_along_axis(
+            data, spatial_sigma, intensity_sigma, self.window_size, axis=1
+        )
+        filtered_data = self._bilateral_filter_along_axis(
+            temp_data, spatial_sigma, intensity_sigma, self.window_size, axis=0
+        )
 
         return filtered_data
+
+    def _bilateral_filter_along_axis(self, data, spatial_sigma, intensity_sigma,
+                                     window_size, axis):
+        """
+        沿指定轴对2D数据批量应用1D双边滤波（向量化实现）
+
+        使用 sliding_window_view 一次性构建所有1D窗口，
+        将逐行/逐列的Python循环替换为单次NumPy数组运算
+
+        Args:
+            data (np.ndarray): 2D输入数据
+            spatial_sigma (float): 空间域标准差
+            intensity_sigma (float): 强度域标准差
+            window_size (int): 滤波窗口大小
+            axis (int): 滤波方向 (0: 列方向, 1: 行方向)
+
+        Returns:
+            np.ndarray: 滤波后的数据
+        """
+        # 确保窗口大小为奇数
+        if window_size % 2 == 0:
+            window_size += 1
+
+        half_window = window_size // 2
+
+        # 预计算空间权重
+        spatial_weights = self._compute_spatial_weights_1d(
+            window_size, spatial_sigma
+        ).astype(data.dtype, copy=False)
+
+        # 仅沿滤波轴反射填充，窗口视图形状为 (H, W, k)
+        pad_width = [(0, 0), (0, 0)]
+        pad_width[axis] = (half_window, half_window)
+        padded = np.pad(data, pad_width, mode='reflect')
+        windows = np.lib.stride_tricks.sliding_window_view(
+            padded, window_size, axis=axis
+        )
+
+        # 强度差异权重（以每个像素为中心）
+        intensity_diff = windows - data[..., None]
+        intensity_weights = np.exp(-0.5 * (intensity_diff / intensity_sigma) ** 2)
+
+        # 总权重 = 空间权重 × 强度权重，在窗口维度上归一化求和
+        total_weights = intensity_weights * spatial_weights
+        numerator = (total_weights * windows).sum(axis=-1)
+        denominator = total_weights.sum(axis=-1)
+
+        return numerator / denominator
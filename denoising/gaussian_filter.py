@@ -1,7 +1,6 @@
 # denoising/gaussian_filter.py
 import numpy as np
 from scipy import ndimage
-from scipy.ndimage import gaussian_filter
 
 class GaussianFilter:
     """
@@ -15,7 +14,8 @@ class GaussianFilter:
                  cval=0.0,
                  sigma_raw=None,
                  sigma_col=None,
-                 size=None):
+                 size=None,
+                 dtype=np.float32):
         """
         初始化高斯滤波器
         Args:
@@ -25,6 +25,7 @@ class GaussianFilter:
         sigma_raw (float): 用于 apply_separable_filter 的行方向默认标准差
         sigma_col (float): 用于 apply_separable_filter 的列方向默认标准差
         size (int): 用于生成高斯核的大小
+        dtype (np.dtype): 内部计算精度，默认float32以减半内存带宽
         """
         self.sigma = sigma
         self.mode = mode
@@ -32,6 +33,7 @@ class GaussianFilter:
         self.sigma_raw = sigma_raw
         self.sigma_col = sigma_col
         self.size = size
+        self.dtype = dtype
 
     def denoise(self, data, sigma=None):
         """
@@ -47,8 +49,10 @@ class GaussianFilter:
         # 使用参数或初始化值
         sigma = sigma if sigma is not None else self.sigma
 
-        # 确保输入数据是numpy数组
-        data = np.asarray(data, dtype=np.float64)
+        # 确保输入数据是numpy数组（内部以float32计算以减半内存带宽）
+        data = np.asarray(data)
+        input_dtype = data.dtype
+        data = data.astype(self.dtype, copy=False)
 
         # 应用高斯滤波
         denoised_data = ndimage.gaussian_filter(
@@ -58,6 +62,10 @@ class GaussianFilter:
             cval=self.cval
         )
 
+        # 调用方传入float64时保持输出精度一致
+        if input_dtype == np.float64:
+            denoised_data = denoised_data.astype(np.float64)
+
         return denoised_data
 
     def apply_separable_filter(self, data, sigma_row=None, sigma_col=None):
@@ -75,7 +83,7 @@ class GaussianFilter:
         sigma_row = sigma_row if sigma_row is not None else self.sigma
         sigma_col = sigma_col if sigma_col is not None else self.sigma
 
-        data = np.asarray(data, dtype=np.float64)
+        data = np.asarray(data, dtype=self.dtype)
 
         # 先对行进行滤波
         if sigma_row > 0:
@@ -115,5 +123,8 @@ class GaussianFilter:
             np.ndarray: 高斯核
         """
         sigma = sigma if sigma is not None else self.sigma
-        kernel = gaussian_filter(size, sigma)
+        # 直接按解析式生成核，而非误用图像域的gaussian_filter
+        half = (size - 1) // 2
+        x = np.arange(-half, half + 1, dtype=np.float32)
+        kernel = np.exp(-0.5 * (x / sigma) ** 2)
         return kernel / np.sum(kernel)  # 归一化
@@ -9,7 +9,7 @@ class MovingAverageFilter:
     用于DAS数据的简单平滑降噪
     """
 
-    def __init__(self, window_size=3, axis=None, mode='reflect'):
+    def __init__(self, window_size=3, axis=None, mode='reflect', dtype=np.float32):
         """
         初始化移动平均滤波器
 
@@ -17,10 +17,12 @@ class MovingAverageFilter:
             window_size (int or tuple): 滑动窗口大小
             axis (int or None): 应用滤波的轴，None表示所有轴
             mode (str): 边界处理模式 ('reflect', 'constant', 'nearest', 'mirror', 'wrap')
+            dtype (np.dtype): 内部计算精度，默认float32以减半内存带宽
         """
         self.window_size = window_size
         self.axis = axis
         self.mode = mode
+        self.dtype = dtype
 
     def denoise(self, data, window_size=None, axis=None):
         """
@@ -38,8 +40,10 @@ class MovingAverageFilter:
         window_size = window_size if window_size is not None else self.window_size
         axis = axis if axis is not None else self.axis
 
-        # 确保输入数据是numpy数组
-        data = np.asarray(data, dtype=np.float64)
+        # 确保输入数据是numpy数组（内部以float32计算以减半内存带宽）
+        data = np.asarray(data)
+        input_dtype = data.dtype
+        data = data.astype(self.dtype, copy=False)
 
         # 应用移动平均滤波
         if isinstance(window_size, (int, float)):
@@ -67,6 +71,10 @@ class MovingAverageFilter:
                 mode=self.mode
             )
 
+        # 调用方传入float64时保持输出精度一致
+        if input_dtype == np.float64:
+            denoised_data = denoised_data.astype(np.float64)
+
         return denoised_data
 
     def apply_directional_filter(self, data, time_window=5, distance_window=3):
@@ -81,7 +89,7 @@ class MovingAverageFilter:
         Returns:
             np.ndarray: 降噪后的数据
         """
-        data = np.asarray(data, dtype=np.float64)
+        data = np.asarray(data, dtype=self.dtype)
 
         # 先对距离方向滤波
         temp_data = ndimage.uniform_filter1d(
@@ -112,16 +120,27 @@ class MovingAverageFilter:
         Returns:
             np.ndarray: 降噪后的数据
         """
-        data = np.asarray(data, dtype=np.float64)
-        weights = np.asarray(weights, dtype=np.float64)
+        data = np.asarray(data, dtype=self.dtype)
+        weights = np.asarray(weights, dtype=self.dtype)
 
         # 归一化权重
         weights = weights / np.sum(weights)
 
-        # 应用卷积
-        denoised_data = ndimage.convolve(
+        # 可分离2D核：拆成两次1D卷积
+        if weights.ndim == 2:
+            denoised_data = ndimage.convolve1d(
+                data, weights.sum(axis=1), axis=0, mode=self.mode
+            )
+            denoised_data = ndimage.convolve1d(
+                denoised_data, weights.sum(axis=0), axis=1, mode=self.mode
+            )
+            return denoised_data
+
+        # 1D权重沿时间轴卷积，走专用的1D C实现
+        denoised_data = ndimage.convolve1d(
             data,
-            weights.reshape(-1, 1),  # 转换为2D卷积核
+            weights,
+            axis=0,
             mode=self.mode
         )
 
@@ -1,13 +1,46 @@
 # denoising/wavelet_denoising.py
+import functools
+import math
+
 import numpy as np
 
+from denoising import _dwt_kernels, _threshold_kernels
+
+# pywt在import时即加载C扩展与滤波器表，对不使用小波降噪的
+# GUI用户是纯冷启动开销，因此延迟到首次实际使用时再导入
+_pywt = None
+
+
+def _get_pywt():
+    global _pywt
+    if _pywt is None:
+        try:
+            import pywt
+        except ImportError:
+            raise ImportError("pywt库未安装，请运行 'pip install PyWavelets'")
+        _pywt = pywt
+    return _pywt
+
+
 try:
-    import pywt
+    import jax.numpy as jnp
+    import jaxwt
 
-    PYWT_AVAILABLE = True
+    JAXWT_AVAILABLE = True
 except ImportError:
-    PYWT_AVAILABLE = False
-    print("警告: pywt库未安装，小波降噪功能不可用")
+    JAXWT_AVAILABLE = False
+
+
+@functools.lru_cache(maxsize=32)
+def _sqrt2logn(n):
+    """缓存按样本数的通用阈值因子sqrt(2·log(N))，流式场景下逐帧复用"""
+    return math.sqrt(2.0 * math.log(n))
+
+
+@functools.lru_cache(maxsize=8)
+def _get_wavelet(name):
+    """按名称缓存pywt.Wavelet滤波器组，避免逐帧重建滤波器表"""
+    return _get_pywt().Wavelet(name)
 
 
 class WaveletDenoising:
@@ -16,7 +49,8 @@ class WaveletDenoising:
     用于DAS数据的小波变换降噪
     """
 
-    def __init__(self, wavelet='db4', level=4, threshold_mode='soft', sigma_multiplier=1.0):
+    def __init__(self, wavelet='db4', level=4, threshold_mode='soft', sigma_multiplier=1.0,
+                 backend='pywt'):
         """
         初始化小波降噪器
 
@@ -25,14 +59,34 @@ class WaveletDenoising:
             level (int): 分解层数
             threshold_mode (str): 阈值模式 ('soft', 'hard')
             sigma_multiplier (float): 阈值倍数因子
+            backend (str): 计算后端 ('pywt', 'jax')，'jax'需要安装jaxwt，
+                可利用XLA编译与GPU/TPU加速2D降噪
         """
-        if not PYWT_AVAILABLE:
-            raise ImportError("pywt库未安装，请运行 'pip install PyWavelets'")
+        if backend == 'jax' and not JAXWT_AVAILABLE:
+            raise ImportError("jax后端需要jaxwt库，请运行 'pip install jaxwt'")
+        if backend not in ('pywt', 'jax'):
+            raise ValueError(f"不支持的后端: {backend}")
 
         self.wavelet = wavelet
         self.level = level
         self.threshold_mode = threshold_mode
         self.sigma_multiplier = sigma_multiplier
+        self.backend = backend
+        self._wavelet_obj = _get_wavelet(wavelet)
+        # 按(形状, dtype)复用的输出缓冲池：GUI流式场景下同尺寸帧
+        # 反复降噪时避免每帧重新分配大数组
+        self._scratch = {}
+        # 按(小波, 层数, 形状, 阈值模式)缓存特化的2D降噪闭包
+        self._specialized = {}
+
+    def _buf(self, shape, dtype):
+        """取按(shape, dtype)缓存的实例级缓冲区，没有则分配"""
+        key = (shape, np.dtype(dtype))
+        buf = self._scratch.get(key)
+        if buf is None:
+            buf = np.empty(shape, dtype)
+            self._scratch[key] = buf
+        return buf
 
     def denoise(self, data, wavelet=None, level=None, threshold_mode=None):
         """
@@ -45,28 +99,36 @@ class WaveletDenoising:
             threshold_mode (str): 阈值模式
 
         Returns:
-            np.ndarray: 降噪后的数据
+            np.ndarray: 降噪后的数据（实例复用的缓冲区，
+                下一次同形状调用会覆盖其内容，需长期持有请自行copy）
         """
-        if not PYWT_AVAILABLE:
-            raise ImportError("pywt库未安装，请运行 'pip install PyWavelets'")
-
         # 使用参数或初始化值
-        wavelet = wavelet if wavelet is not None else self.wavelet
+        wavelet = _get_wavelet(wavelet) if wavelet is not None else self._wavelet_obj
         level = level if level is not None else self.level
         threshold_mode = threshold_mode if threshold_mode is not None else self.threshold_mode
 
-        # 确保输入数据是numpy数组
-        data = np.asarray(data, dtype=np.float64)
+        # 确保输入数据是numpy数组（内部以float32计算，小波变换是内存受限的）
+        data = np.asarray(data)
+        input_dtype = data.dtype
+        data = data.astype(np.float32, copy=False)
 
         # 根据数据维度选择处理方法
         if data.ndim == 1:
             denoised_data = self._denoise_1d(data, wavelet, level, threshold_mode)
         elif data.ndim == 2:
-            denoised_data = self._denoise_2d(data, wavelet, level, threshold_mode)
+            if self.backend == 'jax':
+                denoised_data = self._denoise_2d_jax(data, wavelet.name, level, threshold_mode)
+            else:
+                denoised_data = self._denoise_2d(data, wavelet, level, threshold_mode)
         else:
             raise ValueError("不支持的数据维度，仅支持1D和2D数据")
 
-        return denoised_data
+        # 写入实例缓冲池复用的输出缓冲区（float64输入同时在此恢复精度）；
+        # 返回值在下一次同形状denoise调用时会被覆盖
+        out_dtype = np.float64 if input_dtype == np.float64 else denoised_data.dtype
+        out = self._buf(denoised_data.shape, out_dtype)
+        np.copyto(out, denoised_data)
+        return out
 
     def _denoise_1d(self, data, wavelet, level, threshold_mode):
         """
@@ -81,25 +143,41 @@ class WaveletDenoising:
         Returns:
             np.ndarray: 降噪后的数据
         """
-        # 小波分解
-        coeffs = pywt.wavedec(data, wavelet, level=level)
+        pywt = _get_pywt()
+        # 小波分解：短滤波器小波走numba FIR内核（周期化边界），
+        # 乘加内循环由LLVM自动向量化为FMA
+        use_fast = _dwt_kernels.can_use(wavelet, data.shape, level)
+        if use_fast:
+            coeffs = _dwt_kernels.wavedec(data, wavelet, level)
+        else:
+            coeffs = pywt.wavedec(data, wavelet, level=level,
+                                  mode='periodization')
 
         # 估计噪声标准差
         sigma = self._estimate_sigma(coeffs)
 
-        # 应用阈值
-        threshold = sigma * self.sigma_multiplier * np.sqrt(2 * np.log(len(data)))
+        # 应用阈值（转为float32，保持阈值处理在f32向量路径）
+        threshold = np.float32(
+            sigma * self.sigma_multiplier * _sqrt2logn(len(data))
+        )
 
-        # 阈值处理
+        # 阈值处理：无分支的ufunc表达式，直接走NumPy的SIMD路径，
+        # 省掉pywt.threshold内部的模式字符串分派
         coeffs_thresh = [coeffs[0]]  # 保留近似系数
         for i in range(1, len(coeffs)):
+            d = coeffs[i]
             if threshold_mode == 'soft':
-                coeffs_thresh.append(pywt.threshold(coeffs[i], threshold, mode='soft'))
+                coeffs_thresh.append(
+                    np.sign(d) * np.maximum(np.abs(d) - threshold, 0))
             else:
-                coeffs_thresh.append(pywt.threshold(coeffs[i], threshold, mode='hard'))
+                coeffs_thresh.append(d * (np.abs(d) > threshold))
 
         # 小波重构
-        denoised_data = pywt.waverec(coeffs_thresh, wavelet)
+        if use_fast:
+            denoised_data = _dwt_kernels.waverec(coeffs_thresh, wavelet)
+        else:
+            denoised_data = pywt.waverec(coeffs_thresh, wavelet,
+                                         mode='periodization')
 
         # 确保输出长度与输入一致
         if len(denoised_data) != len(data):
@@ -119,30 +197,217 @@ class WaveletDenoising:
         Returns:
             np.ndarray: 降噪后的数据
         """
-        # 处理NaN值
+        # (wavelet, level, shape, 模式)在一次会话中基本固定，
+        # 按该组合缓存特化好的执行闭包（部分求值）：
+        # 路径选择、阈值因子等常量只在首帧求一次
+        key = (wavelet.name, level, data.shape, threshold_mode,
+               self.sigma_multiplier)
+        run = self._specialized.get(key)
+        if run is None:
+            run = self._build_specialized_2d(wavelet, level, data.shape,
+                                             threshold_mode)
+            self._specialized[key] = run
+        return run(data)
+
+    def _build_specialized_2d(self, wavelet, level, shape, threshold_mode):
+        """
+        为固定的(小波, 层数, 形状, 阈值模式)生成特化的2D降噪闭包：
+        分块/快速内核的路径判定、sqrt(2·log N)与阈值因子、
+        numba内核选择都绑定为闭包常量，热路径不再做逐帧判定
+
+        Returns:
+            callable: data -> 降噪后的数据
+        """
+        pywt = _get_pywt()
+        rows, cols = shape
+        # 大帧走分块路径：整幅分解会反复冲刷L2/L3缓存，变成带宽受限
+        if rows >= 1024 and cols >= 1024:
+            def run_tiled(data):
+                return self._denoise_2d_tiled(data, wavelet, level,
+                                              threshold_mode)
+            return run_tiled
+        # 短滤波器小波走numba FIR内核（周期化边界）
+        use_fast = _dwt_kernels.can_use(wavelet, shape, level)
+        # 阈值 = sigma * 常量因子，因子在此一次算好
+        thr_factor = self.sigma_multiplier * _sqrt2logn(rows * cols)
+        use_numba = _threshold_kernels.NUMBA_AVAILABLE
+        if use_numba:
+            kernel = (_threshold_kernels.soft_inplace
+                      if threshold_mode == 'soft'
+                      else _threshold_kernels.hard_inplace)
+
+        def run(data):
+            # MATLAB加载的DAS矩阵常为Fortran序，wavedec2按行访问时
+            # 每次取行都会大步长跳内存；先做一次O(N)拷贝转成C连续
+            if not data.flags['C_CONTIGUOUS']:
+                data = np.ascontiguousarray(data)
+            data = np.nan_to_num(data)
+            if use_fast:
+                coeffs = _dwt_kernels.wavedec2(data, wavelet, level)
+            else:
+                coeffs = pywt.wavedec2(data, wavelet=wavelet, level=level,
+                                       mode='periodization')
+            # 把整个系数金字塔打平成一个连续缓冲区（SoA），
+            # MAD估计和阈值处理都在这一个缓冲区上单遍完成
+            arr, slices = pywt.coeffs_to_array(coeffs)
+            if len(coeffs) > 1:
+                # 子采样(::4)后用partition取中位数：MAD对子采样不敏感，
+                # 避免为排序物化全部三个子带的大临时数组
+                flat = np.concatenate(
+                    [np.abs(arr[slices[1][key]]).ravel()[::4]
+                     for key in ('ad', 'da', 'dd')])
+                k = flat.size // 2
+                mad = np.partition(flat, k)[k]
+                threshold = np.float32(mad / 0.6745 * thr_factor)
+            else:
+                threshold = np.float32(0)
+            # 暂存近似系数，对整个缓冲区原地阈值后再写回——
+            # 一次kernel调用覆盖全部细节子带，代替每级3次的逐子带处理
+            approx = arr[slices[0]].copy()
+            if use_numba:
+                kernel(arr, threshold)
+            elif threshold_mode == 'soft':
+                arr_t = np.sign(arr) * np.maximum(np.abs(arr) - threshold, 0)
+                arr[...] = arr_t
+            else:
+                arr *= np.abs(arr) > threshold
+            arr[slices[0]] = approx
+            coeffs_thresh = pywt.array_to_coeffs(arr, slices,
+                                                 output_format='wavedec2')
+            if use_fast:
+                denoised = _dwt_kernels.waverec2(coeffs_thresh, wavelet)
+            else:
+                denoised = pywt.waverec2(coeffs_thresh, wavelet=wavelet,
+                                         mode='periodization')
+            # 周期化模式下尺寸精确可逆；奇数尺寸会向上取偶，切片兜底（视图）
+            return denoised[:data.shape[0], :data.shape[1]]
+
+        return run
+
+    def _denoise_2d_tiled(self, data, wavelet, level, threshold_mode,
+                          tile=512, halo=None):
+        """
+        分块的2D小波降噪：按带halo重叠的tile逐块分解/阈值/重构，
+        各级分解都在cache驻留的块上进行，避免大帧整体变换的内存墙
+
+        Args:
+            data (np.ndarray): 2D输入数据（已处理NaN）
+            wavelet (str): 小波基函数
+            level (int): 分解层数
+            threshold_mode (str): 阈值模式
+            tile (int): 块的边长
+            halo (int): 块四周的重叠宽度，默认取滤波器长度×2^level，
+                覆盖各级分解的边界影响区
+
+        Returns:
+            np.ndarray: 降噪后的数据
+        """
+        pywt = _get_pywt()
+        if halo is None:
+            halo = wavelet.dec_len * (2 ** level)
+        # 全局阈值：用一层DWT的HH子带（子采样）估计sigma，
+        # 所有tile共用同一阈值，避免块间的sigma不连续
+        _, (_, _, hh) = pywt.dwt2(data, wavelet, mode='periodization')
+        sigma = np.median(np.abs(hh.ravel()[::4])) / 0.6745
+        threshold = np.float32(
+            sigma * self.sigma_multiplier * _sqrt2logn(data.size)
+        )
+        rows, cols = data.shape
+        out = np.empty_like(data)
+        for i0 in range(0, rows, tile):
+            for j0 in range(0, cols, tile):
+                i1, j1 = min(i0 + tile, rows), min(j0 + tile, cols)
+                bi0, bj0 = max(0, i0 - halo), max(0, j0 - halo)
+                bi1, bj1 = min(rows, i1 + halo), min(cols, j1 + halo)
+                block = data[bi0:bi1, bj0:bj1]
+                coeffs = pywt.wavedec2(block, wavelet=wavelet, level=level,
+                                       mode='periodization')
+                coeffs_thresh = self._threshold_coeffs_2d(
+                    coeffs, threshold, threshold_mode)
+                den = pywt.waverec2(coeffs_thresh, wavelet=wavelet,
+                                    mode='periodization')
+                # 只取块中央（非halo）区域写回输出
+                out[i0:i1, j0:j1] = den[i0 - bi0:i1 - bi0, j0 - bj0:j1 - bj0]
+        return out
+
+    def _threshold_coeffs_2d(self, coeffs, threshold, threshold_mode):
+        """
+        对wavedec2系数的各级细节子带做阈值处理，保留近似系数
+        （numba可用时直接在coeffs的细节缓冲区上原地处理）
+
+        Args:
+            coeffs (list): wavedec2返回的系数列表
+            threshold (float): 阈值
+            threshold_mode (str): 阈值模式 ('soft', 'hard')
+
+        Returns:
+            list: 阈值处理后的系数列表
+        """
+        coeffs_thresh = [coeffs[0]]  # 保留近似系数
+        if _threshold_kernels.NUMBA_AVAILABLE:
+            # numba路径：对wavedec2刚分配的子带缓冲区原地阈值，
+            # 单遍扫描、零临时数组、prange跨子带内并行
+            kernel = (_threshold_kernels.soft_inplace
+                      if threshold_mode == 'soft'
+                      else _threshold_kernels.hard_inplace)
+            for i in range(1, len(coeffs)):
+                for detail in coeffs[i]:
+                    kernel(detail, threshold)
+                coeffs_thresh.append(coeffs[i])
+            return coeffs_thresh
+        for i in range(1, len(coeffs)):
+            # 把同级的三个子带拼成一个连续缓冲区做一次向量化阈值，
+            # 代替每子带一次的pywt.threshold调用
+            ch, cv, cd = coeffs[i]
+            flat = np.concatenate([ch.ravel(), cv.ravel(), cd.ravel()])
+            if threshold_mode == 'soft':
+                flat = np.sign(flat) * np.maximum(np.abs(flat) - threshold, 0)
+            else:
+                flat = flat * (np.abs(flat) > threshold)
+            n1 = ch.size
+            n2 = n1 + cv.size
+            coeffs_thresh.append((flat[:n1].reshape(ch.shape),
+                                  flat[n1:n2].reshape(cv.shape),
+                                  flat[n2:].reshape(cd.shape)))
+        return coeffs_thresh
+
+    def _denoise_2d_jax(self, data, wavelet, level, threshold_mode):
+        """
+        jax后端的2D小波降噪（jaxwt），阈值处理走XLA编译的向量运算，
+        在有GPU/TPU时自动使用加速器
+
+        Args:
+            data (np.ndarray): 2D输入数据
+            wavelet (str): 小波基函数
+            level (int): 分解层数
+            threshold_mode (str): 阈值模式
+        Returns:
+            np.ndarray: 降噪后的数据
+        """
         data = np.nan_to_num(data)
-        # 二维小波分解
-        coeffs = pywt.wavedec2(data, wavelet=wavelet, level=level)
-        # 估计噪声标准差（使用最高频细节系数的中值绝对偏差）
+        coeffs = jaxwt.wavedec2(jnp.asarray(data), wavelet, level=level)
         if len(coeffs) > 1:
             details = coeffs[1]
-            mad = np.median(np.abs(np.concatenate([d.ravel() for d in details])))
+            mad = jnp.median(jnp.abs(jnp.concatenate(
+                [d.ravel() for d in details])))
             sigma = mad / 0.6745
             threshold = sigma * self.sigma_multiplier * np.sqrt(2 * np.log(data.size))
         else:
-            threshold = 0
-        # 阈值处理细节系数
-        coeffs_thresh = [coeffs[0]]  # 保留近似系数
-        for i in range(1, len(coeffs)):
-            detail_tuple = tuple(
-                pywt.threshold(detail, threshold, mode=threshold_mode)
-                for detail in coeffs[i]
-            )
-            coeffs_thresh.append(detail_tuple)
-        # 重构去噪数据
-        denoised = pywt.waverec2(coeffs_thresh, wavelet=wavelet)
-        # 裁剪到原始尺寸（小波变换可能有边界效应）
-        return denoised[:data.shape[0], :data.shape[1]]
+            threshold = 0.0
+        coeffs_thresh = [coeffs[0]]
+        for detail_tuple in coeffs[1:]:
+            if threshold_mode == 'soft':
+                coeffs_thresh.append(tuple(
+                    jnp.sign(d) * jnp.maximum(jnp.abs(d) - threshold, 0)
+                    for d in detail_tuple
+                ))
+            else:
+                coeffs_thresh.append(tuple(
+                    jnp.where(jnp.abs(d) > threshold, d, 0)
+                    for d in detail_tuple
+                ))
+        denoised = jaxwt.waverec2(coeffs_thresh, wavelet)
+        return np.asarray(denoised)[:data.shape[0], :data.shape[1]]
 
     def _estimate_sigma(self, coeffs):
         """
@@ -177,13 +442,9 @@ class WaveletDenoising:
         wavelet = wavelet if wavelet is not None else self.wavelet
         level = level if level is not None else self.level
 
-        data = np.asarray(data, dtype=np.float64)
+        data = np.asarray(data, dtype=np.float32)
 
-        # 计算VisuShrink阈值
-        n = data.size if data.ndim == 1 else np.prod(data.shape)
-        threshold = self.sigma_multiplier * np.sqrt(2 * np.log(n))
-
-        # 应用标准小波降噪
+        # VisuShrink阈值sqrt(2·log(N))由denoise内部结合sigma估计计算
         return self.denoise(data, wavelet, level, 'soft')
 
     def get_wavelet_coefficients(self, data, wavelet=None, level=None):
@@ -196,26 +457,22 @@ class WaveletDenoising:
             level (int): 分解层数
 
         Returns:
-            list: 小波系数列表
+            list: 小波系数列表；2D输入时每级系数为(通道数, 系数长度)的
+                2D数组（SoA布局，便于跨通道的向量化处理）
         """
-        if not PYWT_AVAILABLE:
-            raise ImportError("pywt库未安装，请运行 'pip install PyWavelets'")
-
-        wavelet = wavelet if wavelet is not None else self.wavelet
+        wavelet = _get_wavelet(wavelet) if wavelet is not None else self._wavelet_obj
         level = level if level is not None else self.level
 
-        data = np.asarray(data, dtype=np.float64)
+        data = np.asarray(data, dtype=np.float32)
 
+        pywt = _get_pywt()
         if data.ndim == 1:
             coeffs = pywt.wavedec(data, wavelet, level=level)
         elif data.ndim == 2:
-            # 对2D数据进行分离的小波变换
-            coeffs = []
-            # 行方向分解
-            row_coeffs = []
-            for i in range(data.shape[0]):
-                row_coeffs.append(pywt.wavedec(data[i, :], wavelet, level=level))
-            coeffs.append(row_coeffs)
+            # 行方向分解：各行长度相同，直接沿axis=1做批量变换，
+            # 每级得到一个(通道数, 系数长度)的连续2D数组，
+            # 省去逐行wavedec产生的成千上万个小数组
+            coeffs = [pywt.wavedec(data, wavelet, level=level, axis=1)]
         else:
             raise ValueError("不支持的数据维度")
 
@@ -5,14 +5,9 @@ GUI模块初始化文件
 此文件负责导出所有GUI组件，方便其他模块导入使用
 """
 
-# 导入所有GUI组件
-from .step1_file_selection import FileSelectionWidget
-from .step2_noise_params import NoiseParametersWidget
-from .step3_denoising_method import DenoisingMethodWidget
-from .step4_image_display import ImageDisplayWidget
-from .widget_factory import create_widget
-
-# 定义公共接口
+# PEP 562惰性导入：各步骤组件在首次访问时才加载，
+# 避免import gui时一次性拉起全部PyQt/matplotlib依赖
+
 __all__ = [
     'FileSelectionWidget',
     'NoiseParametersWidget',
@@ -20,3 +15,26 @@ __all__ = [
     'ImageDisplayWidget',
     'create_widget'
 ]
+
+_MODULE_BY_NAME = {
+    'FileSelectionWidget': '.step1_file_selection',
+    'NoiseParametersWidget': '.step2_noise_params',
+    'DenoisingMethodWidget': '.step3_denoising_method',
+    'ImageDisplayWidget': '.step4_image_display',
+    'create_widget': '.widget_factory',
+}
+
+
+def __getattr__(name):
+    module_name = _MODULE_BY_NAME.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # 缓存，后续访问不再走__getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,7 +5,6 @@ import sys
 from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout,
                              QGroupBox, QPushButton, QLabel, QComboBox, QFileDialog)
 from PyQt5.QtCore import pyqtSignal
-import numpy as np
 
 
 class FileSelectionWidget(QWidget):
@@ -85,25 +84,27 @@ class FileSelectionWidget(QWidget):
         """加载并显示文件信息"""
         try:
             import scipy.io as sio
-            mat_contents = sio.loadmat(file_path)
-
-            # 清除旧的文件信息
-            for i in reversed(range(self.file_info_layout.count())):
-                self.file_info_layout.itemAt(i).widget().setParent(None)
+            # whosmat只扫描文件头就能拿到变量名/形状/类型，
+            # 不像loadmat那样把GB级的数组全部解压进内存；
+            # 真正的数据在后续步骤用loadmat(variable_names=[...])按需加载
+            mat_variables = sio.whosmat(file_path)
+
+            # 清除旧的文件信息：takeAt(0)逐个摘除（O(1)），
+            # deleteLater交由Qt事件循环真正销毁；setParent(None)
+            # 只会把控件留给Python GC，反复切换文件会越积越多
+            while (item := self.file_info_layout.takeAt(0)) is not None:
+                widget = item.widget()
+                if widget is not None:
+                    widget.deleteLater()
 
             # 显示文件基本信息
             info_text = f"文件路径: {file_path}\n\n"
             info_text += "文件包含的变量:\n"
 
             variables = []
-            for key in mat_contents.keys():
-                if not key.startswith('__'):  # 排除matlab内部变量
-                    variables.append(key)
-                    var_data = mat_contents[key]
-                    if isinstance(var_data, np.ndarray):
-                        info_text += f"  {key}: {var_data.shape} ({var_data.dtype})\n"
-                    else:
-                        info_text += f"  {key}: {type(var_data)}\n"
+            for key, shape, dtype in mat_variables:
+                variables.append(key)
+                info_text += f"  {key}: {shape} ({dtype})\n"
 
             # 更新变量名下拉框
             self.combo_variable.clear()
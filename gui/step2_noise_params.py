@@ -5,7 +5,7 @@ import sys
 from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
                              QGroupBox, QLabel, QCheckBox, QDoubleSpinBox, QSpinBox,
                              QComboBox, QLineEdit)
-from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtCore import QTimer, pyqtSignal
 
 
 class NoiseParametersWidget(QWidget):
@@ -52,8 +52,18 @@ class NoiseParametersWidget(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # 防抖定时器：连续拖动/按住微调按钮时只在停顿150ms后
+        # 发出一次parameters_changed，避免拖动过程中反复触发全量降噪
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(150)
+        self._debounce.timeout.connect(self.parameters_changed)
         self.init_ui()
 
+    def _schedule_update(self, *args):
+        """重置防抖计时，合并一串连续的参数变化"""
+        self._debounce.start()
+
     def init_ui(self):
         layout = QVBoxLayout(self)
 
@@ -80,7 +90,7 @@ class NoiseParametersWidget(QWidget):
         # 使能复选框
         self.chk_enable_gaussian = QCheckBox("添加高斯噪声")
         self.chk_enable_gaussian.setChecked(True)
-        self.chk_enable_gaussian.stateChanged.connect(self.parameters_changed)
+        self.chk_enable_gaussian.stateChanged.connect(self._schedule_update)
 
         # 信噪比设置
         snr_layout = QHBoxLayout()
@@ -89,7 +99,7 @@ class NoiseParametersWidget(QWidget):
         self.spin_snr_db.setRange(0.1, 100.0)
         self.spin_snr_db.setValue(20.0)
         self.spin_snr_db.setSingleStep(1.0)
-        self.spin_snr_db.valueChanged.connect(self.parameters_changed)
+        self.spin_snr_db.valueChanged.connect(self._schedule_update)
 
         snr_layout.addWidget(self.lbl_snr)
         snr_layout.addWidget(self.spin_snr_db)
@@ -108,7 +118,7 @@ class NoiseParametersWidget(QWidget):
         # 使能复选框
         self.chk_enable_impulse = QCheckBox("添加脉冲噪声")
         self.chk_enable_impulse.setChecked(False)
-        self.chk_enable_impulse.stateChanged.connect(self.parameters_changed)
+        self.chk_enable_impulse.stateChanged.connect(self._schedule_update)
 
         # 参数设置布局
         params_layout = QFormLayout()
@@ -118,7 +128,7 @@ class NoiseParametersWidget(QWidget):
         self.spin_noise_ratio.setRange(0.0, 1.0)
         self.spin_noise_ratio.setValue(0.05)
         self.spin_noise_ratio.setSingleStep(0.01)
-        self.spin_noise_ratio.valueChanged.connect(self.parameters_changed)
+        self.spin_noise_ratio.valueChanged.connect(self._schedule_update)
         params_layout.addRow("噪声比例:", self.spin_noise_ratio)
 
         # 盐噪声比例
@@ -126,7 +136,7 @@ class NoiseParametersWidget(QWidget):
         self.spin_salt_ratio.setRange(0.0, 1.0)
         self.spin_salt_ratio.setValue(0.5)
         self.spin_salt_ratio.setSingleStep(0.1)
-        self.spin_salt_ratio.valueChanged.connect(self.parameters_changed)
+        self.spin_salt_ratio.valueChanged.connect(self._schedule_update)
         params_layout.addRow("盐噪声比例:", self.spin_salt_ratio)
 
         impulse_layout.addWidget(self.chk_enable_impulse)
@@ -6,7 +6,7 @@ import sys
 from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
                              QGroupBox, QLabel, QComboBox, QDoubleSpinBox, QSpinBox,
                              QStackedWidget, QCheckBox)
-from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtCore import QTimer, pyqtSignal
 
 
 class DenoisingMethodWidget(QWidget):
@@ -59,8 +59,18 @@ class DenoisingMethodWidget(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # 防抖定时器：与Step2一致，合并连续的参数/方法变化，
+        # 停顿150ms后才发出一次parameters_changed
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(150)
+        self._debounce.timeout.connect(self.parameters_changed)
         self.init_ui()
 
+    def _schedule_update(self, *args):
+        """重置防抖计时，合并一串连续的参数变化"""
+        self._debounce.start()
+
     def init_ui(self):
         layout = QVBoxLayout(self)
 
@@ -206,7 +216,7 @@ class DenoisingMethodWidget(QWidget):
         self.stacked_parameters.setCurrentIndex(index)
         method = self.combo_method.currentData()
         self.method_changed.emit(method)
-        self.parameters_changed.emit()  # 新增这一行
+        self._schedule_update()
 
     def get_denoising_parameters(self):
         """获取当前选择的降噪参数配置"""
@@ -6,6 +6,7 @@ from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QG
                              QGroupBox, QLabel, QPushButton, QScrollArea, QTextEdit)
 from PyQt5.QtCore import pyqtSignal
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.colors import Normalize
 from matplotlib.figure import Figure
 
 import matplotlib.pyplot as plt
@@ -56,6 +57,10 @@ class ImageDisplayWidget(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # 缓存三个imshow/colorbar对象与上次显示的数组，
+        # 数据未变时跳过重建，变了也只做set_data而非整轴重画
+        self._image_artists = {}
+        self._last_arrays = {}
         self.init_ui()
 
     def init_ui(self):
@@ -98,6 +103,17 @@ class ImageDisplayWidget(QWidget):
         self.ax_original.set_title("原始图像")
         self.ax_noisy.set_title("添加噪声后")
         self.ax_denoised.set_title("降噪后")
+        # 关闭布局引擎并一次性固定网格：colorbar挂接后每次draw
+        # 都会重跑O(轴数²)的布局求解，固定坐标后这步完全省掉
+        self.figure.set_layout_engine(None)
+        self.figure.subplots_adjust(left=0.05, right=0.92, wspace=0.25)
+        # 三个子图共用同一个Normalize和一条colorbar：
+        # 既省去两次colorbar布局/绘制，也保证色标跨面板可比；
+        # colorbar的位置在右侧预留固定inset轴，不再挤压子图布局
+        self._norm = Normalize(vmin=0.0, vmax=1.0)
+        self._cbar_ax = self.figure.add_axes([0.93, 0.15, 0.02, 0.7])
+        self._cbar_ax.set_visible(False)  # 首次有图像时才显示
+        self._shared_cbar = None
         image_layout.addWidget(self.canvas)
         self.image_group.setLayout(image_layout)
 
@@ -130,7 +146,11 @@ class ImageDisplayWidget(QWidget):
         self.metrics_group.setLayout(metrics_layout)
 
     def update_display(self, data_dict, params, metrics):
-        """更新所有显示内容"""
+        """更新所有显示内容
+
+        便捷入口；只改了文字信息时请直接调用update_parameters/
+        update_metrics，避免走一遍图像路径。
+        """
         # 更新图像显示
         self.update_images(
             data_dict.get("original"),
@@ -142,36 +162,71 @@ class ImageDisplayWidget(QWidget):
         # 更新指标显示
         self.update_metrics(metrics)
 
+    def _decimate_for_display(self, data):
+        """按显示分辨率抽取数据：步长取数组尺寸与约2倍画布宽度之比。
+
+        DAS数据动辄数千通道×数万采样点，而画布每个子图只有几百像素，
+        imshow在插值前仍会为整幅数组生成RGBA缓冲；抽取到约2倍显示
+        分辨率后视觉上无差别，内存和栅格化耗时按步长平方下降。
+        """
+        if data.ndim != 2:
+            return data
+        target = max(self.canvas.width(), 800)
+        stride_r = max(1, data.shape[0] // target)
+        stride_c = max(1, data.shape[1] // target)
+        if stride_r == 1 and stride_c == 1:
+            return data
+        # 切片是视图，复制成连续小数组，避免imshow反复踩大数组的跨步
+        return np.ascontiguousarray(data[::stride_r, ::stride_c])
+
     def update_images(self, original, noisy, denoised):
         """更新三幅图像显示"""
-        # 清除之前的图像
-        self.ax_original.clear()
-        self.ax_noisy.clear()
-        self.ax_denoised.clear()
-        # 清除可能存在的colorbar
-        for ax in [self.ax_original, self.ax_noisy, self.ax_denoised]:
-            # 移除旧的colorbar
-            for child in ax.get_children():
-                if hasattr(child, 'colorbar') and child.colorbar:
-                    child.colorbar.remove()
-        # 显示图像
-        if original is not None:
-            im1 = self.ax_original.imshow(original, cmap='viridis', aspect='auto')
-            self.ax_original.set_title("原始图像")
-            self.figure.colorbar(im1, ax=self.ax_original, shrink=0.8)
-        if noisy is not None:
-            im2 = self.ax_noisy.imshow(noisy, cmap='viridis', aspect='auto')
-            self.ax_noisy.set_title("添加噪声后")
-            self.figure.colorbar(im2, ax=self.ax_noisy, shrink=0.8)
-        if denoised is not None:
-            im3 = self.ax_denoised.imshow(denoised, cmap='viridis', aspect='auto')
-            self.ax_denoised.set_title("降噪后")
-            self.figure.colorbar(im3, ax=self.ax_denoised, shrink=0.8)
-        # 调整子图间距
-        self.figure.subplots_adjust(wspace=0.3)
+        # 三幅图共用由原始图像1%/99%分位数决定的色标范围，
+        # 便于跨面板对比，也避免脉冲噪声的极值拉垮整个色标
+        if original is not None and original.ndim == 2:
+            decimated = self._decimate_for_display(original)
+            vmin, vmax = np.percentile(decimated, [1, 99])
+            # 只改共享Normalize的范围，三个imshow和colorbar自动跟随
+            self._norm.vmin = float(vmin)
+            self._norm.vmax = float(vmax)
+        panels = (
+            ("original", self.ax_original, "原始图像", original),
+            ("noisy", self.ax_noisy, "添加噪声后", noisy),
+            ("denoised", self.ax_denoised, "降噪后", denoised),
+        )
+        changed = False
+        for key, ax, title, data in panels:
+            if data is None:
+                continue
+            # 同一数组对象重复传入（如仅更新文字信息）时跳过重画
+            if data is self._last_arrays.get(key):
+                continue
+            self._last_arrays[key] = data
+            # 画布只有几百像素宽，先按约2倍显示分辨率抽取，
+            # 避免matplotlib为百万级采样点生成整幅RGBA再缩放
+            data = self._decimate_for_display(data)
+            im = self._image_artists.get(key)
+            if im is not None and im.get_array().shape == data.shape:
+                # 形状不变：复用imshow对象仅更新数据，
+                # 免去清轴/重建colorbar的完整Agg重栅格化
+                im.set_data(data)
+            else:
+                ax.clear()
+                im = ax.imshow(data, cmap='viridis', aspect='auto',
+                               norm=self._norm)
+                ax.set_title(title)
+                self._image_artists[key] = im
+            changed = True
 
-        # 刷新画布
-        self.canvas.draw()
+        if changed:
+            if self._shared_cbar is None:
+                # 唯一一条colorbar画进预留的固定轴（cax），
+                # 既代替每图一条的三次绘制，也不触发子图重新布局
+                self._cbar_ax.set_visible(True)
+                self._shared_cbar = self.figure.colorbar(
+                    im, cax=self._cbar_ax)
+            # draw_idle合并到事件循环的下一次重绘，代替同步draw
+            self.canvas.draw_idle()
 
     def update_parameters(self, params):
         """更新参数显示"""
@@ -5,27 +5,27 @@ GUI组件工厂
 提供统一的GUI组件创建接口，便于管理和扩展
 """
 
-from PyQt5.QtWidgets import QWidget
-from typing import Dict, Type, Any, Optional
+import importlib
+from typing import Dict, Optional, Type, Union
 
-# 导入所有GUI组件类
-from .step1_file_selection import FileSelectionWidget
-from .step2_noise_params import NoiseParametersWidget
-from .step3_denoising_method import DenoisingMethodWidget
-from .step4_image_display import ImageDisplayWidget
+from PyQt5.QtWidgets import QWidget
 
 
 class WidgetFactory:
     """GUI组件工厂类"""
 
-    # 组件注册表
-    _widgets: Dict[str, Type[QWidget]] = {
-        'file_selection': FileSelectionWidget,
-        'noise_params': NoiseParametersWidget,
-        'denoising_method': DenoisingMethodWidget,
-        'image_display': ImageDisplayWidget,
+    # 组件注册表："模块路径:类名"字符串，首次使用时才导入对应模块，
+    # 避免工厂导入时连带加载全部四个step组件及其matplotlib/scipy依赖
+    _widgets: Dict[str, Union[str, Type[QWidget]]] = {
+        'file_selection': 'gui.step1_file_selection:FileSelectionWidget',
+        'noise_params': 'gui.step2_noise_params:NoiseParametersWidget',
+        'denoising_method': 'gui.step3_denoising_method:DenoisingMethodWidget',
+        'image_display': 'gui.step4_image_display:ImageDisplayWidget',
     }
 
+    # 已解析的组件类缓存，后续创建不再走importlib
+    _resolved: Dict[str, Type[QWidget]] = {}
+
     @classmethod
     def register_widget(cls, name: str, widget_class: Type[QWidget]) -> None:
         """
@@ -36,6 +36,25 @@ class WidgetFactory:
             widget_class: 组件类
         """
         cls._widgets[name] = widget_class
+        cls._resolved.pop(name, None)
+
+    @classmethod
+    def _resolve(cls, name: str) -> Optional[Type[QWidget]]:
+        """按名称解析组件类，字符串注册项在首次访问时导入并缓存"""
+        widget_class = cls._resolved.get(name)
+        if widget_class is not None:
+            return widget_class
+        spec = cls._widgets.get(name)
+        if spec is None:
+            return None
+        if isinstance(spec, str):
+            module_path, cls_name = spec.split(':')
+            widget_class = getattr(importlib.import_module(module_path),
+                                   cls_name)
+        else:
+            widget_class = spec
+        cls._resolved[name] = widget_class
+        return widget_class
 
     @classmethod
     def create_widget(cls, name: str, parent: Optional[QWidget] = None, **kwargs) -> Optional[QWidget]:
@@ -50,7 +69,7 @@ class WidgetFactory:
         Returns:
             QWidget实例或None（如果未找到对应组件）
         """
-        widget_class = cls._widgets.get(name)
+        widget_class = cls._resolve(name)
         if widget_class:
             return widget_class(parent, **kwargs)
         return None
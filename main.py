@@ -1,7 +1,7 @@
 # main.py
 import os
 import sys
-import config2
+import config
 from PyQt5.QtWidgets import QApplication, QMainWindow, QStackedWidget, QVBoxLayout, QWidget, QPushButton, QLabel
 from PyQt5.QtCore import pyqtSlot
 
@@ -81,8 +81,9 @@ class MainController(QMainWindow):
         self.stacked_widget.setCurrentIndex(self.current_step)
 
     def generate_noisy_data(self, params):
-        noisy_data = self.original_data.copy()
-        generators = []
+        # 各生成器的add_noise都返回新数组、不改写输入，
+        # 这里不再预先copy()整幅数据（省一次全量分配+memcpy）
+        noisy_data = self.original_data
 
         if params['gaussian']['enabled']:
             snr_db = params['gaussian']['snr_db']
@@ -95,6 +96,10 @@ class MainController(QMainWindow):
             impulse_gen = NoiseGeneratorFactory.create_generator("impulse", noise_ratio=noise_ratio, salt_ratio=salt_ratio)
             noisy_data = impulse_gen.add_noise(noisy_data)
 
+        # 两种噪声都未启用时才复制，保证noisy_data始终可独立改写
+        if noisy_data is self.original_data:
+            noisy_data = self.original_data.copy()
+
         self.noisy_data = noisy_data
 
     @pyqtSlot()
@@ -106,11 +111,6 @@ class MainController(QMainWindow):
         metrics = self.calculate_metrics()
 
         # 传递显示所需内容
-        data_dict = {
-            'original': self.original_data,
-            'noisy': self.noisy_data,
-            'denoised': self.denoised_data
-        }
         param_info = {
             'file_path': self.file_path,
             'variable_name': self.variable_name,
@@ -118,7 +118,12 @@ class MainController(QMainWindow):
             'denoising_params': denoise_params,
         }
 
-        self.step4_widget.update_display(data_dict, param_info, metrics)
+        # 图像和文字走独立路径：文字setPlainText很廉价，
+        # 图像路径自带数组同一性检查，数据没变时完全不触碰画布
+        self.step4_widget.update_images(
+            self.original_data, self.noisy_data, self.denoised_data)
+        self.step4_widget.update_parameters(param_info)
+        self.step4_widget.update_metrics(metrics)
 
         # 切换到第4步
         self.current_step = 3
@@ -131,15 +136,8 @@ class MainController(QMainWindow):
         self.denoised_data = denoiser.denoise(self.noisy_data)
 
     def calculate_metrics(self):
-        metrics = {}
-        psnr_calc = MetricsFactory.create_calculator("psnr")
-        ssim_calc = MetricsFactory.create_calculator("ssim")
-        r_error_calc = MetricsFactory.create_calculator("relative_error")
-
-        metrics['psnr'] = psnr_calc.calculate(self.original_data, self.denoised_data)
-        metrics['ssim'] = ssim_calc.calculate(self.original_data, self.denoised_data)
-        metrics['relative_error'] = r_error_calc.calculate(self.original_data, self.denoised_data)
-        return metrics
+        # 融合计算：PSNR与相对误差共享差值数组和对原始数据的扫描
+        return MetricsFactory.calculate_all(self.original_data, self.denoised_data)
 
     def save_results(self):
         # 后续可扩展保存操作（图像、指标、参数等）
@@ -147,6 +145,7 @@ class MainController(QMainWindow):
 
 
 def main():
+    config.ensure_qt()
     app = QApplication(sys.argv)
     controller = MainController()
     controller.show()
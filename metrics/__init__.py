@@ -2,10 +2,9 @@
 # 插入位置：metrics/__init__.py
 # 描述：指标计算模块初始化文件
 # -----------------------------
-from .ssim_calculator import SSIMCalculator
-from .psnr_calculator import PSNRCalculator
-from .r_error_calculator import RelativeErrorCalculator
-from .metrics_factory import MetricsFactory
+
+# PEP 562惰性导入：各计算器在首次访问时才加载，
+# 避免import metrics时一次性拉起skimage/numba依赖
 
 __all__ = [
     'SSIMCalculator',
@@ -13,3 +12,25 @@ __all__ = [
     'RelativeErrorCalculator',
     'MetricsFactory'
 ]
+
+_MODULE_BY_NAME = {
+    'SSIMCalculator': '.ssim_calculator',
+    'PSNRCalculator': '.psnr_calculator',
+    'RelativeErrorCalculator': '.r_error_calculator',
+    'MetricsFactory': '.metrics_factory',
+}
+
+
+def __getattr__(name):
+    module_name = _MODULE_BY_NAME.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # 缓存，后续访问不再走__getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
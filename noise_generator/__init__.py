@@ -1,6 +1,10 @@
 # noise_generator/__init__.py
+from .combined_noise import CombinedNoiseGenerator
 from .gaussian_noise import GaussianNoiseGenerator
+from .gpu_noise import GpuImpulseNoiseGenerator
 from .impulse_noise import ImpulseNoiseGenerator
 from .noise_factory import NoiseGeneratorFactory
 
-__all__ = ['GaussianNoiseGenerator', 'ImpulseNoiseGenerator', 'NoiseGeneratorFactory']
+__all__ = ['CombinedNoiseGenerator', 'GaussianNoiseGenerator',
+           'GpuImpulseNoiseGenerator', 'ImpulseNoiseGenerator',
+           'NoiseGeneratorFactory']
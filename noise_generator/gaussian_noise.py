@@ -21,21 +21,33 @@ class GaussianNoiseGenerator:
         self.std = std
         self.seed = seed
         self.snr_db = snr_db
-        if seed is not None:
-            np.random.seed(seed)
+        # PCG64 Generator：Ziggurat采样比传统np.random.normal快约2倍，
+        # 且状态挂在实例上，不污染线程不安全的全局随机状态
+        self._rng = np.random.default_rng(seed)
 
     def add_noise(self, data, snr_db=None):
-        data = np.asarray(data, dtype=np.float64)
+        # 保持float32输入不升格到float64，下游降噪/指标的带宽减半；
+        # 整数等其他类型仍转float64
+        data = np.asarray(data)
+        if data.dtype not in (np.float32, np.float64):
+            data = data.astype(np.float64)
         # 如果没有单独提供 snr_db，则尝试使用 self.snr_db
         if snr_db is None and hasattr(self, 'snr_db'):
             snr_db = self.snr_db
         if snr_db is not None:
             noise_std = self._calculate_noise_std_from_snr(data, snr_db)
-            noise = np.random.normal(self.mean, noise_std, data.shape)
         else:
-            noise = np.random.normal(self.mean, self.std, data.shape)
-        noisy_data = data + noise
-        return noisy_data
+            noise_std = self.std
+        # 流式原地加噪：standard_normal(out=)直接填充输出缓冲，
+        # 缩放/平移/叠加全部原地完成，峰值内存从3N降到2N，
+        # 也省去一趟对整幅噪声数组的DRAM读写
+        out = np.empty_like(data)
+        self._rng.standard_normal(dtype=data.dtype, out=out)
+        out *= noise_std
+        if self.mean:
+            out += self.mean
+        out += data
+        return out
 
     def _calculate_noise_std_from_snr(self, data, snr_db):
         """
@@ -48,8 +60,9 @@ class GaussianNoiseGenerator:
         Returns:
             float: 噪声标准差
         """
-        # 计算信号功率
-        signal_power = np.mean(data ** 2)
+        # 计算信号功率：点积直接归约平方和，不物化平方临时数组
+        flat = np.ravel(data)
+        signal_power = np.dot(flat, flat) / flat.size
 
         # 计算噪声功率
         snr_linear = 10 ** (snr_db / 10)
@@ -69,4 +82,4 @@ class GaussianNoiseGenerator:
         Returns:
             np.ndarray: 生成的高斯噪声
         """
-        return np.random.normal(self.mean, self.std, shape)
+        return self._rng.normal(self.mean, self.std, shape)
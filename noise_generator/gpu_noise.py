@@ -0,0 +1,109 @@
+# noise_generator/gpu_noise.py
+import numpy as np
+
+try:
+    import cupy as cp
+
+    CUPY_AVAILABLE = True
+except ImportError:
+    CUPY_AVAILABLE = False
+
+
+class GpuImpulseNoiseGenerator:
+    """
+    GPU脉冲噪声生成器（CuPy后端）
+
+    与ImpulseNoiseGenerator算法一致，但在GPU上执行：加噪逐元素
+    独立、天然并行，百万元素以上的批量扫描（如参数研究）中
+    吞吐可达CPU的数十倍；百万元素以下时主机-设备搬运开销
+    会吃掉收益，小帧请继续用CPU版本
+    """
+
+    def __init__(self, noise_ratio=0.05, salt_ratio=0.5, seed=None):
+        """
+        初始化GPU脉冲噪声生成器
+
+        Args:
+            noise_ratio (float): 噪声像素比例 (0-1)
+            salt_ratio (float): 盐噪声比例 (0-1)，剩余为胡椒噪声
+            seed (int): 随机种子
+
+        Raises:
+            ImportError: 未安装CuPy
+        """
+        if not CUPY_AVAILABLE:
+            raise ImportError("GPU噪声生成需要CuPy库，请运行 'pip install cupy'")
+        self.noise_ratio = noise_ratio
+        self.salt_ratio = salt_ratio
+        self.seed = seed
+        # 与CPU版一致：随机状态挂在实例上，不污染全局。用legacy
+        # RandomState而非default_rng：CuPy的新式Generator尚未实现
+        # choice，无放回抽样只有RandomState提供（p=None时内部
+        # 走permutation）
+        self._rng = cp.random.RandomState(seed)
+
+    def add_noise(self, data, noise_ratio=None, salt_ratio=None):
+        """
+        为数据添加脉冲噪声（在GPU上计算）
+
+        Args:
+            data (np.ndarray | cp.ndarray): 原始数据；传入CuPy数组时
+                结果留在设备上，批量流水线可免去往返拷贝
+            noise_ratio (float): 噪声比例，如果提供则覆盖初始化值
+            salt_ratio (float): 盐噪声比例，如果提供则覆盖初始化值
+
+        Returns:
+            与输入同类型的数组: 添加脉冲噪声后的数据
+        """
+        noise_ratio = noise_ratio if noise_ratio is not None else self.noise_ratio
+        salt_ratio = salt_ratio if salt_ratio is not None else self.salt_ratio
+
+        # numpy输入上传一次并在结尾下载；设备端输入全程零拷贝
+        return_numpy = isinstance(data, np.ndarray)
+        d = cp.ascontiguousarray(cp.asarray(data))
+        if not cp.issubdtype(d.dtype, cp.floating):
+            d = d.astype(cp.float32)
+        noisy = d.copy()
+
+        total_points = noisy.size
+        noise_points = int(total_points * noise_ratio)
+        salt_points = int(noise_points * salt_ratio)
+
+        # 无放回抽样与极值归约都在设备上完成，避免中途同步
+        indices = self._rng.choice(total_points, noise_points, replace=False)
+        data_min = noisy.min()
+        data_max = noisy.max()
+        data_range = data_max - data_min
+
+        # 与CPU版相同的单趟散写：值向量两段填充后一次scatter
+        values = cp.full(noise_points, data_max + 0.1 * data_range,
+                         dtype=noisy.dtype)
+        values[salt_points:] = data_min - 0.1 * data_range
+        noisy.reshape(-1)[indices] = values
+
+        return cp.asnumpy(noisy) if return_numpy else noisy
+
+    def generate_mask(self, shape, noise_ratio=None):
+        """
+        生成脉冲噪声掩码（在GPU上计算，返回numpy数组）
+
+        Args:
+            shape (tuple): 掩码形状
+            noise_ratio (float): 噪声比例
+
+        Returns:
+            np.ndarray: 噪声掩码 (0:正常, 1:盐噪声, 2:胡椒噪声)
+        """
+        noise_ratio = noise_ratio if noise_ratio is not None else self.noise_ratio
+
+        mask = cp.zeros(shape, dtype=cp.int8)
+        total_points = mask.size
+        noise_points = int(total_points * noise_ratio)
+        salt_points = int(noise_points * self.salt_ratio)
+
+        indices = self._rng.choice(total_points, noise_points, replace=False)
+        labels = cp.full(noise_points, 1, dtype=cp.int8)
+        labels[salt_points:] = 2
+        mask.reshape(-1)[indices] = labels
+
+        return cp.asnumpy(mask)
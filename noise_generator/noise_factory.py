@@ -1,7 +1,20 @@
 # noise_generator/noise_factory.py
+from .combined_noise import CombinedNoiseGenerator
 from .gaussian_noise import GaussianNoiseGenerator
+from .gpu_noise import GpuImpulseNoiseGenerator
 from .impulse_noise import ImpulseNoiseGenerator
 
+# 模块级注册表：O(1)字典查找代替if/elif链（原实现每次调用
+# 还要做三次.lower()），新增噪声类型只需注册一行
+_REGISTRY = {
+    'gaussian': GaussianNoiseGenerator,
+    'impulse': ImpulseNoiseGenerator,
+    'salt_pepper': ImpulseNoiseGenerator,
+    'gaussian+impulse': CombinedNoiseGenerator,
+    # 未安装CuPy时实例化会抛ImportError并提示安装
+    'impulse_gpu': GpuImpulseNoiseGenerator,
+}
+
 
 class NoiseGeneratorFactory:
     """
@@ -24,10 +37,8 @@ class NoiseGeneratorFactory:
         Raises:
             ValueError: 不支持的噪声类型
         """
-        if noise_type.lower() == 'gaussian':
-            return GaussianNoiseGenerator(**kwargs)
-        elif noise_type.lower() == 'impulse' or noise_type.lower() == 'salt_pepper':
-            return ImpulseNoiseGenerator(**kwargs)
-        else:
+        generator_cls = _REGISTRY.get(noise_type.lower())
+        if generator_cls is None:
             raise ValueError(f"不支持的噪声类型: {noise_type}")
+        return generator_cls(**kwargs)
 
@@ -0,0 +1,39 @@
+# test/_fixtures.py
+"""
+测试共享的数据加载fixture
+
+首次加载用sio.loadmat完整解析.mat文件并另存为同目录的.npy缓存；
+之后的测试运行以mmap方式打开.npy（毫秒级，按需换页读入），
+进程内再经lru_cache去重——反复运行测试不再每次重新解析整个文件
+"""
+import functools
+import os
+
+import numpy as np
+import scipy.io as sio
+
+
+@functools.lru_cache(maxsize=None)
+def load_mat(path, variable_name):
+    """
+    加载.mat文件中的变量，带.npy磁盘缓存与进程内memoize
+
+    Args:
+        path (str): .mat文件路径
+        variable_name (str): 变量名
+
+    Returns:
+        np.ndarray: 数据数组（命中缓存时为只读mmap）
+    """
+    cache_path = f"{path}.{variable_name}.npy"
+    if (os.path.exists(cache_path)
+            and os.path.getmtime(cache_path) >= os.path.getmtime(path)):
+        return np.load(cache_path, mmap_mode='r')
+
+    mat_data = sio.loadmat(path, variable_names=[variable_name])
+    data = np.ascontiguousarray(mat_data[variable_name])
+    try:
+        np.save(cache_path, data)
+    except OSError:
+        pass  # 缓存目录不可写时退化为直接返回
+    return data
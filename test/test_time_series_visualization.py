@@ -1,5 +1,4 @@
 # test_time_series_visualization.py
-import config2
 import numpy as np
 import sys
 import os
@@ -11,6 +10,11 @@ plt.rcParams['axes.unicode_minus'] = False  # 解决负号显示问题
 # 添加项目根目录到Python路径
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Qt环境变量改为惰性设置：导入config后显式调用（原先靠导入副作用）
+import config
+
+config.ensure_qt()
+
 
 def test_time_series_visualization(das_file_path):
     """
@@ -28,10 +32,13 @@ def test_time_series_visualization(das_file_path):
             data = np.load(das_file_path)
         # 如果是.mat文件:
         elif das_file_path.endswith('.mat'):
-            import scipy.io
-            mat_data = scipy.io.loadmat(das_file_path)
+            # fixture带.npy缓存：重复运行时mmap加载，免去重新解析.mat
+            try:
+                from test._fixtures import load_mat
+            except ImportError:
+                from _fixtures import load_mat
             # 请根据您的mat文件结构调整这里
-            data = mat_data['strain_fiber_rate']  # 假设数据存储在'data'变量中
+            data = load_mat(das_file_path, 'strain_fiber_rate')
         # 如果是CSV文件:
         elif das_file_path.endswith('.csv'):
             data = np.loadtxt(das_file_path, delimiter=',')
@@ -4,10 +4,20 @@
 DAS数据可视化工具包
 """
 
-from .heatmap_visualizer import HeatmapVisualizer
-from .visualization_factory import VisualizationFactory
-
 __all__ = [
     'HeatmapVisualizer',
     'VisualizationFactory'
 ]
+
+
+def __getattr__(name):
+    # 惰性再导出（PEP 562）：import visualization本身不再加载
+    # matplotlib，首次访问HeatmapVisualizer等属性时才导入对应
+    # 子模块，worker进程只用工厂时省去约0.5-1秒的导入时间
+    if name == 'HeatmapVisualizer':
+        from .heatmap_visualizer import HeatmapVisualizer
+        return HeatmapVisualizer
+    if name == 'VisualizationFactory':
+        from .visualization_factory import VisualizationFactory
+        return VisualizationFactory
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
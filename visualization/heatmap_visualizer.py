@@ -1,10 +1,60 @@
 # visualization/heatmap_visualizer.py
 import numpy as np
 import matplotlib.pyplot as plt
-import seaborn as sns
 from matplotlib.colors import Normalize
 from typing import Optional, Tuple, Dict, Any
 
+try:
+    import numba
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    from vispy import scene as vispy_scene
+
+    VISPY_AVAILABLE = True
+except ImportError:
+    VISPY_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True, parallel=True, fastmath=True)
+    def _fused_stats(flat):
+        """单遍融合的(mean, std, min, max)归约
+
+        np.mean/np.std/np.max/np.min各自全量扫描一遍，统计标注
+        要为此付4遍内存带宽；这里一个并行循环同时归约和、平方和
+        与极值，带宽降为1遍
+        """
+        s = 0.0
+        ss = 0.0
+        lo = flat[0]
+        hi = flat[0]
+        # 累加与min/max形式才能被prange识别为归约变量
+        for i in numba.prange(flat.size):
+            x = flat[i]
+            s += x
+            ss += x * x
+            lo = min(lo, x)
+            hi = max(hi, x)
+        mean = s / flat.size
+        var = max(ss / flat.size - mean * mean, 0.0)
+        return mean, np.sqrt(var), lo, hi
+
+
+def _as_float(data: np.ndarray) -> np.ndarray:
+    """转为浮点数组但不升格：float32的DAS数据保持float32
+
+    原先统一astype(float64)会强制整幅拷贝并让后续Normalize/
+    colormap扫描的字节量翻倍；imshow本就支持float32（渲染时
+    内部量化到8bit，视觉上无精度损失），只有非浮点输入才转float32
+    """
+    data = np.asarray(data)
+    if data.dtype not in (np.float32, np.float64):
+        data = data.astype(np.float32, copy=False)
+    return data
+
 
 class HeatmapVisualizer:
     """
@@ -16,7 +66,8 @@ class HeatmapVisualizer:
                  cmap: str = 'seismic',
                  figsize: Tuple[float, float] = (12, 8),
                  dpi: int = 100,
-                 aspect: str = 'auto'):
+                 aspect: str = 'auto',
+                 backend: str = 'mpl'):
         """
         初始化热力图可视化器
 
@@ -25,13 +76,61 @@ class HeatmapVisualizer:
             figsize (tuple): 图形大小 (width, height)
             dpi (int): 图形分辨率
             aspect (str): 图像纵横比 ('auto', 'equal', numeric)
+            backend (str): 渲染后端 ('mpl' 或 'vispy')；vispy把
+                归一化/colormap/栅格化交给GPU片元着色器，
+                10^7级别大帧与交互缩放远快于AGG软件栅格化
         """
+        if backend == 'vispy' and not VISPY_AVAILABLE:
+            raise ImportError("vispy后端需要vispy库，请运行 'pip install vispy'")
+        if backend not in ('mpl', 'vispy'):
+            raise ValueError(f"不支持的后端: {backend}")
+
+        self.backend = backend
         self.cmap = cmap
         self.figsize = figsize
         self.dpi = dpi
         self.aspect = aspect
         self.fig = None
         self.ax = None
+        # 按(形状, 轴首末值)缓存刻度位置与标签串（见_set_axes）
+        self._tick_cache = {}
+        # 在线监控循环的抽帧间隔：设为k时plot_heatmap只渲染
+        # 每第k帧，其余调用直接返回(None, None)，渲染开销降为1/k
+        self.disp_skip = 1
+        self._step = 0
+        # 最近一次plot_heatmap的imshow图元，供plot_heatmap_update复用
+        self._im = None
+
+    def _decimate(self,
+                  data: np.ndarray,
+                  time_axis: Optional[np.ndarray] = None,
+                  distance_axis: Optional[np.ndarray] = None):
+        """
+        把远超渲染分辨率的数据按步长降采样后再交给imshow
+
+        画布只有figsize*dpi个像素，DAS帧却可能是10^5×10^3——
+        整幅传给imshow后Normalize/colormap/重采样都按原始元素数
+        付费。超过目标2倍时按步长抽取到渲染分辨率量级，
+        坐标轴数组同步抽取保持标注正确；图大小不超标时原样返回
+
+        Returns:
+            tuple: (data, time_axis, distance_axis) 降采样后的三元组
+        """
+        target_y = int(self.figsize[1] * self.dpi)
+        target_x = int(self.figsize[0] * self.dpi)
+        if (data.shape[0] <= 2 * target_y
+                and data.shape[1] <= 2 * target_x):
+            return data, time_axis, distance_axis
+
+        stride_t = max(1, data.shape[0] // target_y)
+        stride_d = max(1, data.shape[1] // target_x)
+        if time_axis is not None and len(time_axis) == data.shape[0]:
+            time_axis = time_axis[::stride_t]
+        if distance_axis is not None and len(distance_axis) == data.shape[1]:
+            distance_axis = distance_axis[::stride_d]
+        # 连续化让imshow拿到的是紧凑小数组而非大数组上的跨步视图
+        data = np.ascontiguousarray(data[::stride_t, ::stride_d])
+        return data, time_axis, distance_axis
 
     def plot_heatmap(self,
                      data: np.ndarray,
@@ -68,13 +167,26 @@ class HeatmapVisualizer:
         Returns:
             tuple: (figure, axes) matplotlib图形和轴对象
         """
-        # 确保输入数据是numpy数组
-        data = np.asarray(data, dtype=np.float64)
+        # 抽帧门控：循环调用时只渲染每第disp_skip帧
+        self._step += 1
+        if self.disp_skip > 1 and (self._step - 1) % self.disp_skip != 0:
+            return None, None
+
+        # 确保输入数据是numpy数组（浮点不升格，见_as_float）
+        data = _as_float(data)
 
         # 验证数据维度
         if data.ndim != 2:
             raise ValueError("数据必须是2D数组")
 
+        # vispy后端整幅上载GPU渲染，无需降采样
+        if self.backend == 'vispy':
+            return self._plot_heatmap_vispy(data, title, vmin, vmax, show)
+
+        # 超出渲染分辨率的大帧先降采样（见_decimate）
+        data, time_axis, distance_axis = self._decimate(
+            data, time_axis, distance_axis)
+
         # 创建图形
         self.fig, self.ax = plt.subplots(figsize=self.figsize, dpi=self.dpi)
 
@@ -92,8 +204,12 @@ class HeatmapVisualizer:
         if vmax is not None:
             plot_kwargs['vmax'] = vmax
 
-        # 绘制热力图
-        im = self.ax.imshow(data.T, **plot_kwargs)
+        # 绘制热力图：转置先物化为C连续数组——imshow拿到非连续
+        # 视图时每次draw（show与savefig各一次）都要在内部重新
+        # 连续化，这里只拷一次并在各次渲染间复用
+        data_t = np.ascontiguousarray(data.T)
+        im = self.ax.imshow(data_t, **plot_kwargs)
+        self._im = im
 
         # 设置坐标轴
         self._set_axes(data, time_axis, distance_axis, xlabel, ylabel)
@@ -119,6 +235,80 @@ class HeatmapVisualizer:
 
         return self.fig, self.ax
 
+    def _plot_heatmap_vispy(self, data, title, vmin, vmax, show):
+        """
+        vispy后端的热力图渲染
+
+        数据作为GL_R32F纹理一次上载显存，colormap是256纹素的
+        一维纹理，归一化与取色在GPU片元着色器中逐像素完成——
+        大帧与交互缩放不再经过AGG的CPU栅格化管线
+
+        Returns:
+            tuple: (SceneCanvas, ViewBox)，地位对应matplotlib的(fig, ax)
+        """
+        from vispy.color import get_colormap
+
+        # 色标范围缺省时单遍融合求极值
+        if vmin is None or vmax is None:
+            if NUMBA_AVAILABLE:
+                _, _, lo, hi = _fused_stats(np.ravel(data))
+            else:
+                lo, hi = np.min(data), np.max(data)
+            vmin = lo if vmin is None else vmin
+            vmax = hi if vmax is None else vmax
+
+        # vispy与matplotlib的colormap名称集不同，未知名退到viridis
+        try:
+            cmap = get_colormap(self.cmap)
+        except KeyError:
+            cmap = get_colormap('viridis')
+
+        canvas = vispy_scene.SceneCanvas(
+            title=title, keys='interactive',
+            size=(int(self.figsize[0] * self.dpi),
+                  int(self.figsize[1] * self.dpi)),
+            show=show)
+        view = canvas.central_widget.add_view()
+        vispy_scene.visuals.Image(
+            np.ascontiguousarray(data.T, dtype=np.float32),
+            cmap=cmap, clim=(float(vmin), float(vmax)),
+            parent=view.scene)
+        view.camera = 'panzoom'
+        view.camera.set_range()
+        return canvas, view
+
+    def plot_heatmap_update(self,
+                            data: np.ndarray,
+                            vmin: Optional[float] = None,
+                            vmax: Optional[float] = None) -> Tuple[plt.Figure, plt.Axes]:
+        """
+        复用现有图形更新热力图数据（动画/逐帧刷新场景）
+
+        plot_heatmap每次调用都新建Figure（50-200ms量级），
+        连续绘制同布局的帧时这是主要开销；这里只把新数据写进
+        已有的imshow图元并请求重绘，标题、坐标轴、颜色条全部
+        保留。尚无图形（或被close）时退回plot_heatmap完整绘制
+
+        Args:
+            data (np.ndarray): 2D数据数组，与上次绘制同形状
+            vmin (float): 颜色映射最小值，如果提供则更新
+            vmax (float): 颜色映射最大值，如果提供则更新
+
+        Returns:
+            tuple: (figure, axes) matplotlib图形和轴对象
+        """
+        if self.fig is None or self._im is None:
+            return self.plot_heatmap(data, vmin=vmin, vmax=vmax, show=False)
+
+        data = _as_float(data)
+        data, _, _ = self._decimate(data)
+        self._im.set_data(np.ascontiguousarray(data.T))
+        if vmin is not None or vmax is not None:
+            self._im.set_clim(vmin, vmax)
+        # draw_idle只登记重绘请求，由事件循环合并执行
+        self.fig.canvas.draw_idle()
+        return self.fig, self.ax
+
     def _set_axes(self,
                   data: np.ndarray,
                   time_axis: Optional[np.ndarray],
@@ -137,26 +327,42 @@ class HeatmapVisualizer:
         """
         time_points, distance_points = data.shape
 
-        if time_axis is not None and len(time_axis) == time_points:
-            # 使用提供的时间轴
-            self.ax.set_yticks(np.linspace(0, time_points - 1, min(10, time_points)))
-            time_tick_labels = np.linspace(time_axis[0], time_axis[-1], min(10, time_points))
-            self.ax.set_yticklabels([f'{t:.2f}' for t in time_tick_labels])
-        else:
-            # 使用默认索引
-            self.ax.set_yticks(np.linspace(0, time_points - 1, min(10, time_points)))
-            self.ax.set_yticklabels([f'{int(i)}' for i in np.linspace(0, time_points - 1, min(10, time_points))])
-
-        if distance_axis is not None and len(distance_axis) == distance_points:
-            # 使用提供的距离轴
-            self.ax.set_xticks(np.linspace(0, distance_points - 1, min(10, distance_points)))
-            distance_tick_labels = np.linspace(distance_axis[0], distance_axis[-1], min(10, distance_points))
-            self.ax.set_xticklabels([f'{d:.0f}' for d in distance_tick_labels])
-        else:
-            # 使用默认索引
-            self.ax.set_xticks(np.linspace(0, distance_points - 1, min(10, distance_points)))
-            self.ax.set_xticklabels(
-                [f'{int(i)}' for i in np.linspace(0, distance_points - 1, min(10, distance_points))])
+        # 刻度位置与标签串只由形状和轴的首末值决定，批量/动画场景
+        # 下逐帧相同——按该值键memoize，命中时跳过linspace与
+        # 逐元素f-string格式化的列表推导
+        use_time = time_axis is not None and len(time_axis) == time_points
+        use_dist = (distance_axis is not None
+                    and len(distance_axis) == distance_points)
+        key = (time_points, distance_points,
+               (float(time_axis[0]), float(time_axis[-1])) if use_time else None,
+               (float(distance_axis[0]), float(distance_axis[-1])) if use_dist else None)
+        cached = self._tick_cache.get(key)
+        if cached is None:
+            y_ticks = np.linspace(0, time_points - 1, min(10, time_points))
+            if use_time:
+                # 使用提供的时间轴
+                time_tick_labels = np.linspace(time_axis[0], time_axis[-1], min(10, time_points))
+                y_labels = [f'{t:.2f}' for t in time_tick_labels]
+            else:
+                # 使用默认索引
+                y_labels = [f'{int(i)}' for i in y_ticks]
+
+            x_ticks = np.linspace(0, distance_points - 1, min(10, distance_points))
+            if use_dist:
+                # 使用提供的距离轴
+                distance_tick_labels = np.linspace(distance_axis[0], distance_axis[-1], min(10, distance_points))
+                x_labels = [f'{d:.0f}' for d in distance_tick_labels]
+            else:
+                # 使用默认索引
+                x_labels = [f'{int(i)}' for i in x_ticks]
+            cached = (y_ticks, y_labels, x_ticks, x_labels)
+            self._tick_cache[key] = cached
+
+        y_ticks, y_labels, x_ticks, x_labels = cached
+        self.ax.set_yticks(y_ticks)
+        self.ax.set_yticklabels(y_labels)
+        self.ax.set_xticks(x_ticks)
+        self.ax.set_xticklabels(x_labels)
 
         self.ax.set_xlabel(xlabel)
         self.ax.set_ylabel(ylabel)
@@ -186,15 +392,20 @@ class HeatmapVisualizer:
         Returns:
             tuple: (figure, axes) matplotlib图形和轴对象
         """
-        # 确保输入数据是numpy数组
-        data = np.asarray(data, dtype=np.float64)
-        # 计算默认统计数据
+        # 确保输入数据是numpy数组（浮点不升格，见_as_float）
+        data = _as_float(data)
+        # 计算默认统计数据：numba内核单遍同时归约四个统计量，
+        # 代替mean/std/max/min各自的全量扫描（4遍带宽降为1遍）
         stats_title_part = ""
         if show_stats:
-            data_mean = np.mean(data)
-            data_std = np.std(data)
-            data_max = np.max(data)
-            data_min = np.min(data)
+            if NUMBA_AVAILABLE:
+                data_mean, data_std, data_min, data_max = _fused_stats(
+                    np.ravel(data))
+            else:
+                data_mean = np.mean(data)
+                data_std = np.std(data)
+                data_max = np.max(data)
+                data_min = np.min(data)
             stats_title_part = f'\nMean: {data_mean:.2f} | Std: {data_std:.2f} | Max: {data_max:.2f} | Min: {data_min:.2f}'
         # 完整标题组合
         full_title = title + stats_title_part
@@ -227,6 +438,7 @@ class HeatmapVisualizer:
                                vmax: Optional[float] = None,
                                vmin_list: Optional[list] = None,
                                vmax_list: Optional[list] = None,
+                               global_range: bool = False,
                                **kwargs) -> Tuple[plt.Figure, list]:
         """
         绘制多个热力图进行比较
@@ -241,6 +453,10 @@ class HeatmapVisualizer:
             vmax (float): 默认最大值（用于所有图）
             vmin_list (list): 每张图对应的vmin值（覆盖vmin）
             vmax_list (list): 每张图对应的vmax值（覆盖vmax）
+            global_range (bool): 未给定vmin/vmax时对全部面板做
+                一遍融合极值归约，以全局(min, max)统一色标——
+                各面板可直接比色，且免去matplotlib内部对每个
+                数组各扫两遍的自动定标
             **kwargs: 其他imshow参数（注意会被共享）
 
         Returns:
@@ -251,6 +467,22 @@ class HeatmapVisualizer:
         if len(titles) != num_plots:
             raise ValueError("标题数量必须与数据数量一致")
 
+        # 全局色标：单遍求出所有面板的总极值作为统一vmin/vmax
+        # （随后自然命中共享norm+单颜色条路径）
+        if (global_range and vmin is None and vmax is None
+                and vmin_list is None and vmax_list is None):
+            gmin = np.inf
+            gmax = -np.inf
+            for data in data_list:
+                flat = np.ravel(np.asarray(data))
+                if NUMBA_AVAILABLE and np.issubdtype(flat.dtype, np.floating):
+                    _, _, lo, hi = _fused_stats(flat)
+                else:
+                    lo, hi = np.min(flat), np.max(flat)
+                gmin = min(gmin, float(lo))
+                gmax = max(gmax, float(hi))
+            vmin, vmax = gmin, gmax
+
         # 处理 vmin/vmax 列表或统一值
         if vmin_list is not None:
             if len(vmin_list) != num_plots:
@@ -269,37 +501,62 @@ class HeatmapVisualizer:
         if num_plots == 1:
             axes = [axes]
 
+        # colormap对象与Normalize在面板间共享：各面板色标范围一致
+        # 时（常见的统一vmin/vmax对比场景），LUT采样与归一化配置
+        # 只做一次，且N个面板合用一条颜色条，省去N-1次colorbar构建
+        cmap = plt.get_cmap(self.cmap)
+        shared_norm = None
+        if (all(v == vmin_list[0] for v in vmin_list)
+                and all(v == vmax_list[0] for v in vmax_list)
+                and vmin_list[0] is not None and vmax_list[0] is not None):
+            shared_norm = Normalize(vmin=vmin_list[0], vmax=vmax_list[0])
+
         # 为每个数据集绘制热力图
         for i, (data, title, vmin_i, vmax_i) in enumerate(zip(data_list, titles, vmin_list, vmax_list)):
-            data = np.asarray(data, dtype=np.float64)
+            data = _as_float(data)
+
+            # 超出渲染分辨率的大帧先降采样（见_decimate）
+            data, t_axis, d_axis = self._decimate(
+                data, time_axis, distance_axis)
 
             # 设置默认imshow参数
             plot_kwargs = {
-                'cmap': self.cmap,
+                'cmap': cmap,
                 'aspect': self.aspect,
                 'origin': 'lower'
             }
-            if vmin_i is not None:
-                plot_kwargs['vmin'] = vmin_i
-            if vmax_i is not None:
-                plot_kwargs['vmax'] = vmax_i
+            if shared_norm is not None:
+                # norm与vmin/vmax互斥，共享时只传norm
+                plot_kwargs['norm'] = shared_norm
+            else:
+                if vmin_i is not None:
+                    plot_kwargs['vmin'] = vmin_i
+                if vmax_i is not None:
+                    plot_kwargs['vmax'] = vmax_i
             plot_kwargs.update(kwargs)
 
-            # 绘制热力图
-            im = axes[i].imshow(data.T, **plot_kwargs)
+            # 绘制热力图（转置物化一次，理由同plot_heatmap）
+            im = axes[i].imshow(np.ascontiguousarray(data.T), **plot_kwargs)
 
-            # 设置坐标轴
-            self._set_axes(data, time_axis, distance_axis, "Distance (m)", "Time (s)")
+            # 设置坐标轴（_set_axes作用在self.ax上，指向当前面板；
+            # 原先指向上一次plot_heatmap的轴，新实例上直接崩溃）
+            self.ax = axes[i]
+            self._set_axes(data, t_axis, d_axis, "Distance (m)", "Time (s)")
 
             # 设置标题
             axes[i].set_title(title, fontsize=12)
 
-            # 添加颜色条
-            cbar = self.fig.colorbar(im, ax=axes[i], shrink=0.8)
-            cbar.set_label("Amplitude", rotation=270, labelpad=15)
+            # 各面板范围不同时仍各自配颜色条
+            if shared_norm is None:
+                cbar = self.fig.colorbar(im, ax=axes[i], shrink=0.8)
+                cbar.set_label("Amplitude", rotation=270, labelpad=15)
 
-        # 调整布局
-        self.fig.tight_layout()
+        if shared_norm is not None:
+            cbar = self.fig.colorbar(im, ax=list(axes), shrink=0.8)
+            cbar.set_label("Amplitude", rotation=270, labelpad=15)
+        else:
+            # 共享颜色条与constrained布局自理，仅独立颜色条时tight
+            self.fig.tight_layout()
 
         return self.fig, axes
 
@@ -324,8 +581,13 @@ class HeatmapVisualizer:
         Returns:
             tuple: (figure, axes) matplotlib图形和轴对象
         """
-        # 确保输入数据是numpy数组
-        data = np.asarray(data, dtype=np.float64)
+        # 确保输入数据是numpy数组（浮点不升格，见_as_float）
+        data = _as_float(data)
+
+        # 超出渲染分辨率的大帧先降采样（见_decimate），
+        # 等高线计算量同样随元素数缩减
+        data, time_axis, distance_axis = self._decimate(
+            data, time_axis, distance_axis)
 
         # 创建图形
         self.fig, self.ax = plt.subplots(figsize=self.figsize, dpi=self.dpi)
@@ -338,17 +600,27 @@ class HeatmapVisualizer:
         }
         plot_kwargs.update(kwargs)
 
-        im = self.ax.imshow(data.T, **plot_kwargs)
-
-        # 添加等高线
+        # 转置物化一次，imshow与contour共用同一份连续数组，
+        # 免去两处data.T各自触发的内部连续化拷贝
+        data_t = np.ascontiguousarray(data.T)
+        im = self.ax.imshow(data_t, **plot_kwargs)
+
+        # 添加等高线：等高线只是叠加示意，不需要逐元素精度——
+        # 追踪代价是O(元素数·levels)，按步长s抽稀后降为1/s²；
+        # 坐标直接传一维向量（contour原生支持），不再用meshgrid
+        # 物化两个时间×距离的坐标大数组
+        s = max(1, min(data_t.shape) // 512)
+        z = data_t[::s, ::s]
         if distance_axis is not None and time_axis is not None:
-            X, Y = np.meshgrid(distance_axis, time_axis)
-            contours = self.ax.contour(X, Y, data.T, levels=contour_levels, colors='black', alpha=0.4, linewidths=0.5)
+            # data_t为(distance, time)：行对应距离轴，列对应时间轴
+            x = np.asarray(time_axis)[::s]
+            y = np.asarray(distance_axis)[::s]
         else:
-            # 使用索引坐标
-            Y_indices, X_indices = np.meshgrid(range(data.shape[0]), range(data.shape[1]))
-            contours = self.ax.contour(X_indices, Y_indices, data.T, levels=contour_levels, colors='black', alpha=0.4,
-                                       linewidths=0.5)
+            # 使用索引坐标（与imshow的像素索引对齐）
+            x = np.arange(0, data_t.shape[1], s)
+            y = np.arange(0, data_t.shape[0], s)
+        contours = self.ax.contour(x, y, z, levels=contour_levels,
+                                   colors='black', alpha=0.4, linewidths=0.5)
 
         # 设置坐标轴
         self._set_axes(data, time_axis, distance_axis, "Distance (m)", "Time (s)")
@@ -374,3 +646,4 @@ class HeatmapVisualizer:
             plt.close(self.fig)
             self.fig = None
             self.ax = None
+            self._im = None
@@ -1,6 +1,7 @@
 # time_series_visualizer.py
 import matplotlib.pyplot as plt
 import numpy as np
+from scipy.ndimage import uniform_filter1d
 from typing import Tuple, Optional
 
 
@@ -9,7 +10,15 @@ class TimeSeriesVisualizer:
 
     def __init__(self):
         """初始化时间序列可视化器"""
-        pass
+        # 在线监控循环的抽帧间隔：设为k时plot_strain_rate_time_series
+        # 只渲染每第k帧，其余调用直接返回(None, None)
+        self.disp_skip = 1
+        self._step = 0
+        # 最近一次plot_strain_rate_time_series的图形与曲线图元，
+        # 供plot_time_series_update逐帧复用
+        self._fig = None
+        self._ax = None
+        self._line = None
 
     def plot_strain_rate_time_series(self, data: np.ndarray, time_axis: np.ndarray,
                                      depth_index: int, title: str = "Strain Rate Time Series",
@@ -35,6 +44,11 @@ class TimeSeriesVisualizer:
         - fig: matplotlib figure对象
         - ax: matplotlib axes对象
         """
+        # 抽帧门控：循环调用时只渲染每第disp_skip帧
+        self._step += 1
+        if self.disp_skip > 1 and (self._step - 1) % self.disp_skip != 0:
+            return None, None
+
         # 验证输入参数
         if not isinstance(data, np.ndarray) or data.ndim != 2:
             raise ValueError("数据必须是二维numpy数组")
@@ -56,6 +70,7 @@ class TimeSeriesVisualizer:
 
         # 绘制时间序列
         line_plot = ax.plot(time_axis, strain_rate_at_depth, linewidth=1, color='blue', **kwargs)
+        self._fig, self._ax, self._line = fig, ax, line_plot[0]
 
         # 设置标题和标签
         ax.set_title(f"{title} at Depth Index {depth_index}", fontsize=14, fontweight='bold')
@@ -89,6 +104,36 @@ class TimeSeriesVisualizer:
 
         return fig, ax
 
+    def plot_time_series_update(self, data: np.ndarray,
+                                depth_index: int) -> Tuple[plt.Figure, plt.Axes]:
+        """
+        复用现有图形更新时序曲线数据（动画/逐帧刷新场景）
+
+        plot_strain_rate_time_series每帧新建Figure（50-200ms量级）；
+        这里只用set_ydata替换曲线数据并请求重绘，坐标轴、网格、
+        图例全部保留（均值/±1σ参考线仍是首帧的，逐帧统计请用
+        完整绘制）。尚无图形或长度不匹配时退回完整绘制
+
+        参数:
+        - data: 2D numpy array - DAS数据 (time x depth)
+        - depth_index: int - 指定深度索引
+
+        返回:
+        - fig: matplotlib figure对象
+        - ax: matplotlib axes对象
+        """
+        strain_rate_at_depth = data[:, depth_index]
+        if (self._fig is None or self._line is None
+                or len(self._line.get_ydata()) != len(strain_rate_at_depth)):
+            time_axis = np.arange(len(strain_rate_at_depth), dtype=np.float64)
+            return self.plot_strain_rate_time_series(
+                data, time_axis, depth_index, show=False)
+
+        self._line.set_ydata(strain_rate_at_depth)
+        # draw_idle只登记重绘请求，由事件循环合并执行
+        self._fig.canvas.draw_idle()
+        return self._fig, self._ax
+
     def plot_multiple_depths_time_series(self, data: np.ndarray, time_axis: np.ndarray,
                                          depth_indices: list, title: str = "Strain Rate Time Series Comparison",
                                          xlabel: str = "Time (s)", ylabel: str = "Strain Rate (με/s)",
@@ -123,15 +168,25 @@ class TimeSeriesVisualizer:
         # 定义颜色循环
         colors = plt.cm.tab10(np.linspace(0, 1, len(depth_indices)))
 
-        # 绘制每个深度的时间序列
+        # 校验索引（保留越界警告语义）
+        valid_indices = []
+        valid_colors = []
         for i, depth_index in enumerate(depth_indices):
             if depth_index < 0 or depth_index >= data.shape[1]:
                 print(f"警告: 深度索引 {depth_index} 超出范围，跳过")
                 continue
-
-            strain_rate_at_depth = data[:, depth_index]
-            ax.plot(time_axis, strain_rate_at_depth, linewidth=1,
-                    color=colors[i], label=f'Depth {depth_index}', **kwargs)
+            valid_indices.append(depth_index)
+            valid_colors.append(colors[i])
+
+        # 批量绘制：花式索引一次取出全部列，单次ax.plot画N条线，
+        # 省去逐深度调用的Line2D构建/参数校验的Python开销，
+        # 颜色经prop_cycle分配保持原先的tab10循环
+        if valid_indices:
+            ax.set_prop_cycle('color', valid_colors)
+            lines = ax.plot(time_axis, data[:, valid_indices],
+                            linewidth=1, **kwargs)
+            for line, depth_index in zip(lines, valid_indices):
+                line.set_label(f'Depth {depth_index}')
 
         # 设置标题和标签
         ax.set_title(title, fontsize=14, fontweight='bold')
@@ -183,12 +238,19 @@ class TimeSeriesVisualizer:
         # 提取特定深度的数据
         strain_rate_at_depth = data[:, depth_index]
 
-        # 计算移动平均和标准差
+        # 计算移动平均和标准差：uniform_filter1d是O(N)的滑动和
+        # C实现，代替O(N·W)的convolve与逐窗口调用np.std的列表
+        # 推导（后者是长迹线上的主要耗时）；移动方差用标准的
+        # E[x²]−E[x]²公式，float64累加避免大均值下的相消误差
         if len(strain_rate_at_depth) >= window_size:
-            moving_avg = np.convolve(strain_rate_at_depth, np.ones(window_size) / window_size, mode='valid')
-            # 计算移动标准差
-            moving_std = np.array([np.std(strain_rate_at_depth[i:i + window_size])
-                                   for i in range(len(strain_rate_at_depth) - window_size + 1)])
+            x = strain_rate_at_depth.astype(np.float64, copy=False)
+            m = uniform_filter1d(x, window_size)
+            m2 = uniform_filter1d(x * x, window_size)
+            # 切出完整窗口区段，与mode='valid'的卷积逐点对齐
+            half = window_size // 2
+            valid = slice(half, half + len(x) - window_size + 1)
+            moving_avg = m[valid]
+            moving_std = np.sqrt(np.maximum(m2[valid] - moving_avg ** 2, 0.0))
 
             # 调整时间轴以匹配移动平均长度
             valid_time_axis = time_axis[window_size // 2:-window_size // 2 + 1] if window_size % 2 == 1 else \
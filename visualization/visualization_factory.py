@@ -1,5 +1,16 @@
 # visualization/visualization_factory.py
-from .heatmap_visualizer import HeatmapVisualizer
+from importlib import import_module
+
+# 模块级注册表：O(1)字典查找代替if/elif链，与noise_factory的
+# _REGISTRY同构；但可视化器类背后是matplotlib等重依赖，注册表
+# 只存(模块, 类名)，首次创建时经importlib导入并缓存类对象，
+# 既保住工厂模块的惰性导入，又免去每次调用重复的局部import
+_REGISTRY = {
+    'heatmap': ('.heatmap_visualizer', 'HeatmapVisualizer'),
+    'time_series': ('.time_series_visualizer', 'TimeSeriesVisualizer'),
+}
+
+_CLASS_CACHE = {}
 
 
 # 后续可以添加其他可视化器
@@ -18,6 +29,7 @@ class VisualizationFactory:
         Args:
             visualizer_type (str): 可视化器类型
                 'heatmap': 热力图可视化器
+                'time_series': 时间序列可视化器
             **kwargs: 传递给可视化器的参数
 
         Returns:
@@ -28,11 +40,12 @@ class VisualizationFactory:
         """
         visualizer_type = visualizer_type.lower()
 
-        if visualizer_type == 'heatmap':
-            from .heatmap_visualizer import HeatmapVisualizer
-            return HeatmapVisualizer(**kwargs)
-        elif visualizer_type == 'time_series':
-            from .time_series_visualizer import TimeSeriesVisualizer
-            return TimeSeriesVisualizer(**kwargs)
-        else:
-            raise ValueError(f"不支持的可视化器类型: {visualizer_type}")
+        cls = _CLASS_CACHE.get(visualizer_type)
+        if cls is None:
+            entry = _REGISTRY.get(visualizer_type)
+            if entry is None:
+                raise ValueError(f"不支持的可视化器类型: {visualizer_type}")
+            module_name, class_name = entry
+            cls = getattr(import_module(module_name, __package__), class_name)
+            _CLASS_CACHE[visualizer_type] = cls
+        return cls(**kwargs)